@@ -0,0 +1,73 @@
+"""
+Jeeves - Human-like browser typing automation
+asyncio API: typing jobs that wait on the event loop instead of a thread
+"""
+
+import asyncio
+
+from telemetry import CallbackSink
+
+
+class TypingJob:
+    """
+    A typing run in a task on the event loop, started by Jeeves.start_async.
+
+    Await the job for its result, the same bool type_with_realism returns
+    (details are in the instance's last_result). Iterate it with
+    `async for` to receive every telemetry snapshot of the run, ending with
+    the final one. pause(), resume() and cancel() control the run; a
+    cancelled job still completes normally, with a False result.
+
+    Args:
+        typer (Jeeves): The instance to type with; it runs one job at a time
+        text (str): The text to type
+        resume (bool): Continue from the last committed character
+    """
+
+    def __init__(self, typer, text, resume=False):
+        self.typer = typer
+        self._snapshots = asyncio.Queue()
+        self._sink = CallbackSink(self._snapshots.put_nowait)
+        self._cancelled = False
+        self.task = asyncio.get_running_loop().create_task(self._run(text, resume))
+        # End the progress stream however the task ends, even if it is cancelled before it runs
+        self.task.add_done_callback(lambda task: self._snapshots.put_nowait(None))
+
+    async def _run(self, text, resume):
+        if self._cancelled:
+            return False
+        self.typer.telemetry_sinks.append(self._sink)
+        try:
+            return await self.typer.type_async(text, resume)
+        finally:
+            self.typer.telemetry_sinks.remove(self._sink)
+
+    def __await__(self):
+        return self.task.__await__()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        snapshot = await self._snapshots.get()
+        if snapshot is None:
+            self._snapshots.put_nowait(None)  # Keep later iterations finished too
+            raise StopAsyncIteration
+        return snapshot
+
+    def pause(self):
+        """Pause the run before its next keystroke."""
+        self.typer.pause()
+
+    def resume(self):
+        """Resume a paused run."""
+        self.typer.resume()
+
+    def cancel(self):
+        """Stop the run before its next keystroke; awaiting the job then gives False."""
+        self._cancelled = True
+        self.typer.cancel()
+
+    def done(self):
+        """Whether the run has finished."""
+        return self.task.done()
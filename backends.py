@@ -0,0 +1,330 @@
+"""
+Jeeves - Human-like browser typing automation
+Keystroke injection backends
+"""
+
+import re
+import sys
+import time
+
+PASTE_MODIFIER = 'command' if sys.platform == 'darwin' else 'ctrl'
+
+
+class KeystrokeBackend:
+    """
+    Base class for keystroke injection backends.
+
+    A backend only delivers keys; all timing is decided by the caller.
+    `write` types literal text, `press` sends a named key such as 'backspace',
+    `hotkey` a key combination and `paste` delivers text through the clipboard.
+    """
+
+    name = None
+    charset = None  # Regex character class body of the characters write() can type (None = any)
+
+    def write(self, text):
+        """Type `text` literally."""
+        raise NotImplementedError
+
+    def press(self, key):
+        """Press and release the named key."""
+        raise NotImplementedError
+
+    def hotkey(self, *keys):
+        """Hold the given keys down in order, then release them, e.g. hotkey('ctrl', 'v')."""
+        raise NotImplementedError
+
+    def paste(self, text):
+        """Put `text` on the clipboard and send the paste shortcut."""
+        import pyperclip
+        pyperclip.copy(text)
+        self.hotkey(PASTE_MODIFIER, 'v')
+
+    def close(self):
+        """Release any resources held by the backend."""
+
+
+class PyAutoGUIBackend(KeystrokeBackend):
+    """
+    Inject keys through pyautogui.
+
+    pyautogui sleeps for `pyautogui.PAUSE` (0.1 s by default) after every
+    call, which caps throughput near 10 keys per second. Since the scheduler
+    owns inter-key timing, the pause is set to `pause` (0 by default).
+    """
+
+    name = "pyautogui"
+    charset = r"\t\n\r\x20-\x7e"  # pyautogui.write silently skips anything else
+
+    def __init__(self, pause=0.0):
+        import pyautogui
+        self._pyautogui = pyautogui
+        pyautogui.PAUSE = pause
+
+    def write(self, text):
+        self._pyautogui.write(text)
+
+    def press(self, key):
+        self._pyautogui.press(key)
+
+    def hotkey(self, *keys):
+        self._pyautogui.hotkey(*keys)
+
+
+class XTestBackend(KeystrokeBackend):
+    """
+    Inject keys directly through the X11 XTEST extension using python-xlib.
+
+    Each key costs a couple of requests on an already open connection,
+    with no per-call sleep. Characters without a key on the current layout
+    are typed by binding them to a spare keycode. When the server has no
+    spare keycode, `charset` is narrowed to the characters on the layout,
+    so the rest is pasted instead.
+    """
+
+    name = "xtest"
+    SCRATCH_SETTLE = 0.05  # Seconds the scratch binding is kept after a tap, so clients read the key with it
+
+    SPECIAL_KEYS = {
+        'backspace': 'BackSpace',
+        'enter': 'Return',
+        'return': 'Return',
+        'tab': 'Tab',
+        'esc': 'Escape',
+        'escape': 'Escape',
+        'space': 'space',
+        'left': 'Left',
+        'right': 'Right',
+        'up': 'Up',
+        'down': 'Down',
+        'home': 'Home',
+        'end': 'End',
+        'delete': 'Delete',
+        'ctrl': 'Control_L',
+        'shift': 'Shift_L',
+        'alt': 'Alt_L',
+        'command': 'Super_L',
+    }
+    CONTROL_CHARS = {'\n': 'Return', '\r': 'Return', '\t': 'Tab', '\b': 'BackSpace'}
+
+    def __init__(self, display=None):
+        from Xlib import X, XK
+        from Xlib.display import Display
+        from Xlib.ext import xtest
+        self._X = X
+        self._XK = XK
+        self._xtest = xtest
+        self.display = Display(display)
+        if not self.display.has_extension('XTEST'):
+            raise RuntimeError("X server does not support the XTEST extension")
+        self._shift = self.display.keysym_to_keycode(XK.XK_Shift_L)
+        first = self.display.display.info.min_keycode
+        mapping = self.display.get_keyboard_mapping(first, self.display.display.info.max_keycode - first + 1)
+        self._scratch = self._find_scratch_keycode(first, mapping)
+        self._scratch_keysym = 0  # Keysym currently bound to the scratch keycode
+        self._scratch_tapped = 0.0  # perf_counter time of the last scratch tap
+        if self._scratch is None:
+            self.charset = self._layout_charset(mapping)
+        self._cache = {}  # char -> (keycode, needs_shift)
+
+    @staticmethod
+    def _find_scratch_keycode(first, mapping):
+        """Find a keycode with no keysyms bound that can be remapped on demand."""
+        for index, keysyms in enumerate(mapping):
+            if not any(keysyms):
+                return first + index
+        return None
+
+    @staticmethod
+    def _layout_charset(mapping):
+        """Regex character class body of the characters on the plain and Shift levels of `mapping`."""
+        chars = {'\t', '\n', '\r'}
+        for keysyms in mapping:
+            for keysym in keysyms[:2]:
+                if 0x20 <= keysym <= 0x7e or 0xa0 <= keysym <= 0xff:
+                    chars.add(chr(keysym))
+                elif keysym & 0xff000000 == 0x01000000:
+                    chars.add(chr(keysym & 0xffffff))
+        return "".join(re.escape(char) for char in sorted(chars))
+
+    @staticmethod
+    def _char_to_keysym(char):
+        code = ord(char)
+        if 0x20 <= code <= 0x7e or 0xa0 <= code <= 0xff:
+            return code
+        return 0x01000000 | code
+
+    def _lookup(self, keysym):
+        """
+        Return (keycode, needs_shift) for a keysym on the current layout, or None.
+
+        Only the plain and Shift levels count; a keysym that needs AltGr or
+        another modifier is typed through the scratch keycode instead.
+        """
+        bindings = self.display.keysym_to_keycodes(keysym)  # Sorted by level, easiest first
+        if not bindings or bindings[0][1] > 1:
+            return None
+        keycode, index = bindings[0]
+        return keycode, index == 1
+
+    def _tap(self, keycode, shift=False):
+        X = self._X
+        if shift:
+            self._xtest.fake_input(self.display, X.KeyPress, self._shift)
+        self._xtest.fake_input(self.display, X.KeyPress, keycode)
+        self._xtest.fake_input(self.display, X.KeyRelease, keycode)
+        if shift:
+            self._xtest.fake_input(self.display, X.KeyRelease, self._shift)
+
+    def _bind_scratch(self, keysym):
+        """
+        Bind `keysym` to the scratch keycode (0 unbinds it).
+
+        Clients reload their keymap lazily, so a binding changed right after
+        a tap can make them read the key with the new keysym. The binding is
+        kept for SCRATCH_SETTLE seconds after the last tap before it changes.
+        """
+        wait = self._scratch_tapped + self.SCRATCH_SETTLE - time.perf_counter()
+        if wait > 0:
+            time.sleep(wait)
+        self.display.change_keyboard_mapping(self._scratch, [(keysym, keysym)])
+        self.display.sync()
+        self._scratch_keysym = keysym
+
+    def _tap_unmapped(self, keysym):
+        """Type `keysym` through the scratch keycode, rebinding it only when it holds another keysym."""
+        if self._scratch is None:
+            raise RuntimeError(f"No spare keycode to type keysym {keysym:#x} with; it is not on the keyboard layout")
+        if keysym != self._scratch_keysym:
+            self._bind_scratch(keysym)
+        self._tap(self._scratch)
+        self.display.flush()
+        self._scratch_tapped = time.perf_counter()
+
+    def write(self, text):
+        for char in text:
+            key = self._cache.get(char)
+            if key is None:
+                if char in self.CONTROL_CHARS:
+                    keysym = self._XK.string_to_keysym(self.CONTROL_CHARS[char])
+                else:
+                    keysym = self._char_to_keysym(char)
+                key = self._lookup(keysym)
+                if key is None or key[0] == self._scratch:
+                    self._tap_unmapped(keysym)
+                    continue
+                self._cache[char] = key
+            self._tap(*key)
+        self.display.flush()
+
+    def _keycode(self, key):
+        keysym = self._XK.string_to_keysym(self.SPECIAL_KEYS.get(key.lower(), key))
+        found = self._lookup(keysym)
+        if found is None:
+            raise ValueError(f"Unknown key: {key}")
+        return found[0]
+
+    def press(self, key):
+        self._tap(self._keycode(key))
+        self.display.flush()
+
+    def hotkey(self, *keys):
+        keycodes = [self._keycode(key) for key in keys]
+        for keycode in keycodes:
+            self._xtest.fake_input(self.display, self._X.KeyPress, keycode)
+        for keycode in reversed(keycodes):
+            self._xtest.fake_input(self.display, self._X.KeyRelease, keycode)
+        self.display.flush()
+
+    def close(self):
+        if self._scratch_keysym:
+            self._bind_scratch(0)
+        self.display.close()
+
+
+class RecordingBackend(KeystrokeBackend):
+    """
+    Record keystrokes in memory instead of injecting them.
+
+    Every call is stored as (perf_counter, kind, value) in `events`, and
+    `text` holds what a text field would contain after the run. Useful for
+    tests, benchmarks and dry runs.
+    """
+
+    name = "recording"
+
+    def __init__(self):
+        self.events = []
+        self._typed = []
+
+    def write(self, text):
+        self.events.append((time.perf_counter(), "write", text))
+        self._typed.append(text)
+
+    def press(self, key):
+        self.events.append((time.perf_counter(), "press", key))
+        if key == 'backspace':
+            self._typed.append('\b')
+        elif key in ('enter', 'return'):
+            self._typed.append('\n')
+
+    def hotkey(self, *keys):
+        self.events.append((time.perf_counter(), "hotkey", "+".join(keys)))
+
+    def paste(self, text):
+        self.events.append((time.perf_counter(), "paste", text))
+        self._typed.append(text)
+
+    @property
+    def text(self):
+        """The text as it would appear on screen, with backspaces applied."""
+        result = []
+        for char in "".join(self._typed):
+            if char == '\b':
+                if result:
+                    result.pop()
+            else:
+                result.append(char)
+        return "".join(result)
+
+
+class NullBackend(KeystrokeBackend):
+    """Discard every keystroke. Measures the engine's own overhead."""
+
+    name = "null"
+
+    def write(self, text):
+        pass
+
+    def press(self, key):
+        pass
+
+    def hotkey(self, *keys):
+        pass
+
+    def paste(self, text):
+        pass
+
+
+BACKENDS = {
+    backend.name: backend
+    for backend in (PyAutoGUIBackend, XTestBackend, RecordingBackend, NullBackend)
+}
+
+
+def create_backend(name, **options):
+    """
+    Create a keystroke backend by name.
+
+    Args:
+        name (str): One of the keys of BACKENDS
+        **options: Keyword arguments for the backend constructor
+
+    Returns:
+        KeystrokeBackend: The new backend
+    """
+    try:
+        backend_class = BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown backend '{name}'. Available: {', '.join(BACKENDS)}") from None
+    return backend_class(**options)
@@ -0,0 +1,156 @@
+"""
+Jeeves - Human-like browser typing automation
+Batch mode: type many documents in one warm process
+"""
+
+import json
+import time
+from colorama import Fore, Style
+
+
+def load_manifest(manifest_path):
+    """
+    Load a JSONL job manifest.
+
+    Each non-empty line is a JSON object with either "text" or "file", and
+    optionally "id", "window" (title to target), "window_index",
+    "match_mode" and "config" (per-job configuration overrides). Lines
+    starting with '#' are ignored.
+
+    Returns:
+        list: The job dictionaries, in order
+    """
+    jobs = []
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                job = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{manifest_path}:{line_number}: invalid JSON ({e})") from None
+            if not isinstance(job, dict) or not ("text" in job or "file" in job):
+                raise ValueError(f"{manifest_path}:{line_number}: a job needs a 'text' or 'file' field")
+            job.setdefault("id", len(jobs))
+            jobs.append(job)
+    return jobs
+
+
+def job_config(base_config, job):
+    """Build the effective configuration of a job from the shared base configuration."""
+    from typing_core import Jeeves
+
+    config = Jeeves.merge_config(base_config, job.get("config"))
+    browser = config["browser"]
+    if "window" in job:
+        browser["window_title"] = job["window"]
+    if "window_index" in job:
+        browser["window_index"] = job["window_index"]
+    if "match_mode" in job:
+        browser["match_mode"] = job["match_mode"]
+    return config
+
+
+def _window_target(config):
+    browser = config["browser"]
+    return browser["window_title"], browser["window_index"], browser["match_mode"]
+
+
+def run_job(typer, job, base_config):
+    """
+    Run one job on a warm Jeeves instance.
+
+    The instance keeps its backend, random generator and window handle
+    between jobs; the window is only looked up again (and the focus delay
+    only paid) when the job targets a different window than the last one.
+    A job that overrides engine.seed reseeds the generator, and one that
+    overrides engine.backend or engine.backend_options types through its
+    own backend, closed again when the job ends.
+
+    Args:
+        typer (Jeeves): The shared instance
+        job (dict): A manifest entry
+        base_config (dict): Configuration that per-job overrides apply to
+
+    Returns:
+        dict: The job's result record
+    """
+    result = {"id": job["id"], "status": "failed", "chars": 0, "elapsed": 0.0,
+              "typos": 0, "pauses": 0, "error": None}
+    previous_target = _window_target(typer.config)
+    warm_backend = None
+    try:
+        text = job.get("text")
+        if text is None:
+            with open(job["file"], 'r', encoding='utf-8') as f:
+                text = f.read()
+
+        typer.config = job_config(base_config, job)
+        if _window_target(typer.config) != previous_target:
+            typer.current_browser_window = None
+
+        # The generator and backend are cached on the instance, so engine overrides must be applied to it
+        engine = (job.get("config") or {}).get("engine", {})
+        if "seed" in engine:
+            typer.seed(typer.config["engine"]["seed"])
+        if "backend" in engine or "backend_options" in engine:
+            from backends import create_backend
+
+            backend = create_backend(typer.config["engine"]["backend"], **typer.config["engine"]["backend_options"])
+            warm_backend, typer.backend = typer.backend, backend
+
+        completed = typer.type_with_realism(text)
+        result.update({key: typer.last_result[key] for key in ("chars", "elapsed", "typos", "pauses", "error")})
+        result["status"] = "ok" if completed else "failed"
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    finally:
+        if warm_backend is not None:
+            typer.backend.close()
+            typer.backend = warm_backend
+        result["elapsed"] = round(result["elapsed"], 3)
+    return result
+
+
+def run_batch(typer, jobs, results_path=None):
+    """
+    Type every job in order within this process.
+
+    Args:
+        typer (Jeeves): A configured instance whose config is the base for every job
+        jobs (list): Jobs from load_manifest
+        results_path (str): JSONL file receiving one result record per job
+
+    Returns:
+        list: The result records
+    """
+    base_config = typer.config
+    results = []
+    results_file = open(results_path, 'w', encoding='utf-8') if results_path else None
+    start = time.perf_counter()
+    try:
+        for number, job in enumerate(jobs, 1):
+            if typer.verbose:
+                print(f"{Fore.CYAN}► Job {number}/{len(jobs)}: {Fore.WHITE}{job['id']}{Style.RESET_ALL}")
+            result = run_job(typer, job, base_config)
+            results.append(result)
+            if results_file:
+                results_file.write(json.dumps(result) + "\n")
+                results_file.flush()
+            if result["status"] != "ok":
+                print(f"{Fore.RED}✗ Job {job['id']} failed: {result['error']}{Style.RESET_ALL}")
+    finally:
+        typer.config = base_config
+        if results_file:
+            results_file.close()
+
+    if typer.verbose:
+        succeeded = sum(1 for r in results if r["status"] == "ok")
+        print(f"\n{Fore.GREEN}✓ Batch finished{Style.RESET_ALL}")
+        print(f"  {Fore.BLUE}• Jobs succeeded: {Fore.CYAN}{succeeded}/{len(results)}{Style.RESET_ALL}")
+        print(f"  {Fore.BLUE}• Characters typed: {Fore.CYAN}{sum(r['chars'] for r in results)}{Style.RESET_ALL}")
+        print(f"  {Fore.BLUE}• Total time: {Fore.CYAN}{time.perf_counter() - start:.2f}s{Style.RESET_ALL}")
+        if results_path:
+            print(f"  {Fore.BLUE}• Results written to: {Fore.CYAN}{results_path}{Style.RESET_ALL}")
+    return results
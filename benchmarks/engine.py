@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Jeeves - Human-like browser typing automation
+Engine benchmarks: overhead, throughput ceiling and timing accuracy
+
+Types representative corpora (prose, code, unicode) through Jeeves against
+the in-process FakeInjector and FakeWindowProvider (see fakes.py), so no
+display or GUI packages are needed, and measures:
+
+- throughput: characters and keystrokes per second with every delay at
+  zero, i.e. the engine's own ceiling, and the per-keystroke overhead;
+  for single keystrokes, coalesced bursts and the asyncio driver
+- accuracy: how far keystrokes land from their planned times, and how the
+  achieved mean interval compares to the configured delays
+- keyboard: building the neighbour index and get_nearby_keys lookups
+- config: creating a Jeeves instance and loading a configuration file
+
+Results can be written as JSON and compared against an earlier run; the
+comparison exits non-zero when a metric regressed by more than the
+tolerance.
+
+Usage:
+    python benchmarks/engine.py [--quick] [--json] [--output FILE] [--compare BASELINE]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from fakes import FakeInjector, FakeWindowProvider  # noqa: E402
+from typing_core import Jeeves  # noqa: E402
+from window_manager import WindowRegistry  # noqa: E402
+
+CORPORA = {
+    "prose": (
+        "It was a bright cold day in April, and the clocks were striking thirteen. "
+        "The hallway smelt of boiled cabbage and old rag mats; at one end of it a coloured "
+        "poster, too large for indoor display, had been tacked to the wall.\n\n"
+        "Outside, even through the shut window-pane, the world looked cold. Down in the street "
+        "little eddies of wind were whirling dust and torn paper into spirals.\n\n"
+    ),
+    "code": (
+        "def merge_intervals(intervals):\n"
+        "    \"\"\"Merge overlapping [start, end) intervals.\"\"\"\n"
+        "    merged = []\n"
+        "    for start, end in sorted(intervals):\n"
+        "        if merged and start <= merged[-1][1]:\n"
+        "            merged[-1][1] = max(merged[-1][1], end)\n"
+        "        else:\n"
+        "            merged.append([start, end])\n"
+        "    return {'count': len(merged), 'spans': merged}  # O(n log n)\n\n"
+    ),
+    "unicode": (
+        "Crème brûlée, smørrebrød and jalapeño — naïve café façades in São Paulo. "
+        "Ελληνικά κείμενα, русский текст, 日本語のテキスト, 中文字符 and emoji 🙂🚀✨. "
+        "Math: ∑ x² ≤ ∞, arrows → ← ↔, currency € £ ¥ ₹.\n\n"
+    ),
+}
+
+# Delays used for the accuracy benchmark (seconds): short, so a run takes a few seconds
+ACCURACY_DELAYS = (0.002, 0.006)
+
+
+def corpus(name, size):
+    """The named corpus repeated to exactly `size` characters."""
+    base = CORPORA[name]
+    return (base * (size // len(base) + 1))[:size]
+
+
+def make_typer(injector, min_delay=0.0, max_delay=0.0, burst_threshold=0.0):
+    """A quiet Jeeves instance typing into the fakes, without typos or pauses."""
+    typer = Jeeves(verbose=False, backend=injector,
+                   window_registry=WindowRegistry(FakeWindowProvider(["Benchmark - Google Chrome"])))
+    config = typer.config
+    config["typing_speed"].update(min_delay=min_delay, max_delay=max_delay, mistake_probability=0.0,
+                                  correction_delay=0.0)
+    config["human_behavior"].update(pause_probability=0.0, paragraph_pause=0.0)
+    config["browser"]["focus_delay"] = 0.0
+    config["engine"]["burst_threshold"] = burst_threshold
+    typer.seed(0)
+    return typer
+
+
+def run_typer(typer, text, driver="sync"):
+    """Type `text` and return the wall and CPU time it took (seconds)."""
+    wall, cpu = time.perf_counter(), time.process_time()
+    if driver == "async":
+        completed = asyncio.run(typer.type_async(text))
+    else:
+        completed = typer.type_with_realism(text)
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    if not completed:
+        raise RuntimeError(f"Benchmark run failed: {typer.last_result['error']}")
+    return wall, cpu
+
+
+def bench_throughput(size, repeat):
+    """Zero-delay throughput per corpus and mode, best of `repeat` runs."""
+    from typing_plan import build_keystroke_plan
+
+    modes = {
+        "keystrokes": {"burst_threshold": 0.0, "driver": "sync"},
+        "bursts": {"burst_threshold": Jeeves.DEFAULT_CONFIG["engine"]["burst_threshold"], "driver": "sync"},
+        "async": {"burst_threshold": 0.0, "driver": "async"},
+    }
+    results = {}
+    for name in CORPORA:
+        text = corpus(name, size)
+        for mode, options in modes.items():
+            best = None
+            for _ in range(repeat):
+                injector = FakeInjector()
+                typer = make_typer(injector, burst_threshold=options["burst_threshold"])
+                wall, _ = run_typer(typer, text, options["driver"])
+                if best is None or wall < best[0]:
+                    best = (wall, len(injector.times))
+            wall, calls = best
+            results[f"throughput.{name}.{mode}.chars_per_sec"] = (size / wall, "chars/s", "higher")
+            results[f"throughput.{name}.{mode}.overhead_us"] = (wall / calls * 1e6, "us/call", "lower")
+
+        typer = make_typer(FakeInjector())
+        seconds = min(timeit.repeat(lambda: build_keystroke_plan(text, typer.config, typer.rng),
+                                    number=1, repeat=repeat))
+        results[f"throughput.{name}.plan_us_per_char"] = (seconds / size * 1e6, "us/char", "lower")
+    return results
+
+
+def bench_accuracy(size):
+    """Timing error against planned deadlines and configured delays, per corpus and driver."""
+    low, high = ACCURACY_DELAYS
+    expected = (low + high) / 2
+    results = {}
+    for name in CORPORA:
+        text = corpus(name, size)
+        for driver in ("sync", "async"):
+            injector = FakeInjector()
+            typer = make_typer(injector, low, high)
+            wall, cpu = run_typer(typer, text, driver)
+            stats = typer.timing_stats
+            times = injector.times
+            interval = (times[-1] - times[0]) / (len(times) - 1)
+            prefix = f"accuracy.{name}.{driver}"
+            results[f"{prefix}.mean_error_us"] = (stats["mean"] * 1e6, "us", "lower")
+            results[f"{prefix}.p99_error_us"] = (stats["p99"] * 1e6, "us", "lower")
+            results[f"{prefix}.max_error_us"] = (stats["max"] * 1e6, "us", None)
+            results[f"{prefix}.jitter_us"] = (stats["jitter"] * 1e6, "us", "lower")
+            results[f"{prefix}.interval_error_pct"] = (100 * (interval - expected) / expected, "%", None)
+            results[f"{prefix}.cpu_pct"] = (100 * cpu / wall, "%", None)
+    return results
+
+
+def bench_keyboard(repeat):
+    """Neighbour index construction per layout and key lookup cost."""
+    from keyboard_layout import LAYOUTS, _build_index, get_nearby_keys, sample_nearby_key
+
+    results = {}
+    for layout, rows in LAYOUTS.items():
+        seconds = min(timeit.repeat(lambda: _build_index(rows), number=1, repeat=repeat))
+        results[f"keyboard.{layout}.build_ms"] = (seconds * 1e3, "ms", "lower")
+
+    chars = CORPORA["prose"] + CORPORA["code"] + CORPORA["unicode"]
+    number = 20
+    seconds = min(timeit.repeat(lambda: [get_nearby_keys(char) for char in chars], number=number, repeat=repeat))
+    results["keyboard.get_nearby_keys_ns"] = (seconds / number / len(chars) * 1e9, "ns/call", "lower")
+    seconds = min(timeit.repeat(lambda: [sample_nearby_key(char, 0.5) for char in chars],
+                                number=number, repeat=repeat))
+    results["keyboard.sample_nearby_key_ns"] = (seconds / number / len(chars) * 1e9, "ns/call", "lower")
+    return results
+
+
+def bench_config(repeat):
+    """Creating a Jeeves instance and loading the default and a user configuration."""
+    typer = Jeeves(verbose=False)
+    number = 200
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "config.json")
+        with open(path, 'w') as f:
+            json.dump({"typing_speed": {"min_delay": 0.03, "max_delay": 0.1},
+                       "browser": {"window_title": "Firefox"}}, f)
+        cases = {
+            "create": lambda: Jeeves(verbose=False),
+            "load_default": lambda: typer.load_config(None),
+            "load_file": lambda: typer.load_config(path),
+        }
+        for case, function in cases.items():
+            seconds = min(timeit.repeat(function, number=number, repeat=repeat))
+            results[f"config.{case}_us"] = (seconds / number * 1e6, "us", "lower")
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """
+    Compare results against a baseline from an earlier --output.
+
+    Returns:
+        list: (metric, baseline value, current value, relative change) of
+        every metric that got worse by more than `tolerance`
+    """
+    regressions = []
+    for metric, (value, _, better) in results.items():
+        previous = baseline.get(metric)
+        if better is None or previous is None or not previous["value"]:
+            continue
+        change = (value - previous["value"]) / abs(previous["value"])
+        if (change > tolerance) if better == "lower" else (change < -tolerance):
+            regressions.append((metric, previous["value"], value, change))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Jeeves typing engine against fake injectors")
+    parser.add_argument("--quick", action="store_true", help="Smaller inputs and fewer repeats")
+    parser.add_argument("--only", choices=("throughput", "accuracy", "keyboard", "config"), action="append",
+                        help="Run only this group (repeatable)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--output", metavar="FILE", help="Also write the results as JSON to FILE")
+    parser.add_argument("--compare", metavar="BASELINE", help="Compare against results saved with --output")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Relative change counted as a regression with --compare (default: 0.25)")
+    args = parser.parse_args()
+
+    size, accuracy_size, repeat = (2000, 200, 2) if args.quick else (20000, 600, 5)
+    groups = {
+        "throughput": lambda: bench_throughput(size, repeat),
+        "accuracy": lambda: bench_accuracy(accuracy_size),
+        "keyboard": lambda: bench_keyboard(repeat),
+        "config": lambda: bench_config(repeat),
+    }
+    results = {}
+    for group, run in groups.items():
+        if not args.only or group in args.only:
+            results.update(run())
+
+    metrics = {metric: {"value": round(value, 3), "unit": unit, "better": better}
+               for metric, (value, unit, better) in results.items()}
+    report = {"python": sys.version.split()[0], "platform": sys.platform, "quick": args.quick,
+              "metrics": metrics}
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    regressions = []
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            regressions = compare(results, json.load(f)["metrics"], args.tolerance)
+
+    if args.json:
+        report["regressions"] = [metric for metric, *_ in regressions]
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"{'Metric':<48} {'Value':>12}  Unit")
+        for metric, (value, unit, _) in results.items():
+            print(f"{metric:<48} {value:>12.2f}  {unit}")
+        if args.compare:
+            print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%} against {args.compare}")
+            for metric, previous, value, change in regressions:
+                print(f"  {metric}: {previous:.2f} -> {value:.2f} ({change:+.0%})")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
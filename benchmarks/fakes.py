@@ -0,0 +1,80 @@
+"""
+Jeeves - Human-like browser typing automation
+In-process stand-ins for pyautogui and pygetwindow used by the benchmarks
+"""
+
+import time
+from array import array
+
+from backends import KeystrokeBackend
+
+
+class FakeInjector(KeystrokeBackend):
+    """
+    A keystroke backend that only timestamps its calls.
+
+    Each call appends one perf_counter value to `times` (an array, so
+    recording stays cheap compared to the engine being measured) and
+    counts the characters it was given. With `latency`, each call
+    busy-waits that long first, standing in for a real injector's cost.
+    """
+
+    name = "fake"
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.times = array('d')
+        self.chars = 0
+
+    def _inject(self):
+        now = time.perf_counter()
+        if self.latency:
+            end = now + self.latency
+            while time.perf_counter() < end:
+                pass
+        self.times.append(now)
+
+    def write(self, text):
+        self._inject()
+        self.chars += len(text)
+
+    def press(self, key):
+        self._inject()
+
+    def hotkey(self, *keys):
+        self._inject()
+
+    def paste(self, text):
+        self._inject()
+        self.chars += len(text)
+
+
+class FakeWindow:
+    """A window that is always visible and focuses instantly."""
+
+    def __init__(self, provider, title):
+        self._provider = provider
+        self.title = title
+        self.visible = True
+
+    def activate(self):
+        self._provider.active = self
+
+
+class FakeWindowProvider:
+    """
+    A pygetwindow stand-in with a fixed set of windows.
+
+    Args:
+        titles (list): Window titles, in enumeration order
+    """
+
+    def __init__(self, titles=("Benchmark - Google Chrome",)):
+        self.windows = [FakeWindow(self, title) for title in titles]
+        self.active = None
+
+    def getAllWindows(self):
+        return list(self.windows)
+
+    def getActiveWindow(self):
+        return self.active
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Jeeves - Human-like browser typing automation
+Startup-time budget for CLI invocations that don't type anything
+
+Runs each command under `python -X importtime`, checks that none of the
+heavy GUI/numeric modules were imported and that import time and wall time
+stay within budget. Exits non-zero when a budget is exceeded.
+
+Usage:
+    python benchmarks/startup.py [--repeat N] [--json]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+JEEVES = os.path.join(ROOT, "jeeves.py")
+
+# Modules that must never be imported by config or listing operations
+FORBIDDEN_MODULES = ("numpy", "pyautogui", "pygetwindow", "tqdm", "Xlib")
+
+# Budgets in milliseconds, measured as the best of --repeat runs
+IMPORT_BUDGET_MS = 80.0  # Sum of top-level import times reported by -X importtime
+WALL_BUDGET_MS = 250.0  # Whole process, including interpreter startup
+
+
+def commands(workdir):
+    """The invocations covered by the budget, as argument lists for jeeves.py."""
+    return {
+        "help": ["--help"],
+        "version": ["-q", "--version"],
+        "create-config": ["-q", "--create-config", os.path.join(workdir, "created.json")],
+        "save-config": ["-q", "--save-config", os.path.join(workdir, "saved.json")],
+        "bad-argument": ["--no-such-flag"],
+    }
+
+
+def parse_importtime(stderr):
+    """
+    Parse `-X importtime` output.
+
+    Returns:
+        tuple: (total top-level import time in ms, set of imported module names)
+    """
+    total_us = 0
+    modules = set()
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue  # Header line
+        modules.add(name.strip().split(".")[0])
+        if not name.startswith("  "):  # Two spaces of padding mark a top-level import
+            total_us += int(cumulative)
+    return total_us / 1000.0, modules
+
+
+def measure(args, repeat):
+    """Run jeeves.py with `args` `repeat` times and keep the fastest run."""
+    best_import, best_wall, modules = None, None, set()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", JEEVES] + args,
+            cwd=ROOT, capture_output=True, text=True,
+        )
+        wall = (time.perf_counter() - start) * 1000.0
+        import_ms, imported = parse_importtime(proc.stderr)
+        modules |= imported
+        best_import = import_ms if best_import is None else min(best_import, import_ms)
+        best_wall = wall if best_wall is None else min(best_wall, wall)
+    return {
+        "import_ms": round(best_import, 2),
+        "wall_ms": round(best_wall, 2),
+        "forbidden_imports": sorted(m for m in FORBIDDEN_MODULES if m in modules),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the Jeeves CLI startup-time budget")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per command (best is kept)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        results = {name: measure(cmd, args.repeat) for name, cmd in commands(workdir).items()}
+
+    failed = False
+    for result in results.values():
+        result["ok"] = (
+            not result["forbidden_imports"]
+            and result["import_ms"] <= IMPORT_BUDGET_MS
+            and result["wall_ms"] <= WALL_BUDGET_MS
+        )
+        failed |= not result["ok"]
+
+    if args.json:
+        print(json.dumps({"budget": {"import_ms": IMPORT_BUDGET_MS, "wall_ms": WALL_BUDGET_MS},
+                          "results": results}, indent=2))
+    else:
+        print(f"{'Command':<15} {'Imports (ms)':>13} {'Wall (ms)':>10}  Status")
+        for name, result in results.items():
+            status = "ok" if result["ok"] else "OVER BUDGET"
+            if result["forbidden_imports"]:
+                status += f" (imported {', '.join(result['forbidden_imports'])})"
+            print(f"{name:<15} {result['import_ms']:>13.2f} {result['wall_ms']:>10.2f}  {status}")
+        print(f"Budget: {IMPORT_BUDGET_MS:.0f} ms imports, {WALL_BUDGET_MS:.0f} ms wall")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
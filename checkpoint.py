@@ -0,0 +1,112 @@
+"""
+Jeeves - Human-like browser typing automation
+Checkpoints: resume an interrupted typing job from its last committed character
+"""
+
+import hashlib
+import json
+import os
+import time
+from colorama import Fore, Style
+
+CHECKPOINT_VERSION = 1
+
+
+def text_digest(text):
+    """SHA-256 of the text, identifying which text a checkpoint belongs to."""
+    return hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def load_checkpoint(path):
+    """
+    Read a checkpoint written by CheckpointSink.
+
+    Returns:
+        dict: The checkpoint, or None if there is no checkpoint at `path`
+    """
+    try:
+        with open(path, 'r') as f:
+            checkpoint = json.load(f)
+    except FileNotFoundError:
+        return None
+    if checkpoint.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version in {path}")
+    return checkpoint
+
+
+class CheckpointSink:
+    """
+    A telemetry sink that keeps a resumable checkpoint of one typing run.
+
+    The checkpoint holds the text hash, the number of characters committed
+    to the target window and the random generator state the keystroke plan
+    was built from, so a resumed run replans the same keystrokes and skips
+    the ones already typed. Writes are batched: telemetry already limits how
+    often update() is called, and the file is only rewritten when
+    `interval` seconds have passed since the last write. The final state is
+    always written when the run stops; a completed run removes the file.
+    If the file cannot be written, checkpointing is disabled with a warning
+    and the run carries on.
+
+    Args:
+        path (str): Checkpoint file
+        digest (str): text_digest() of the text being typed
+        rng_state (dict): Bit generator state from before the plan was built
+        offset (int): Characters already committed before this run started
+        interval (float): Minimum time between writes (seconds)
+        pending_typo (bool): Whether the resumed text ends with an uncorrected typo
+    """
+
+    def __init__(self, path, digest, rng_state, offset=0, interval=2.0, pending_typo=False):
+        self.path = path
+        self.digest = digest
+        self.rng_state = rng_state
+        self.offset = offset
+        self.interval = interval
+        self.pending_typo = pending_typo
+        self._tmp_path = f"{path}.tmp"
+        self._next_write = 0.0
+        self._written = None
+        self.enabled = True
+
+    def committed(self, snapshot):
+        """Characters of the text that are on screen according to `snapshot`."""
+        return self.offset + snapshot["chars"]
+
+    def write(self, snapshot):
+        # A typo that has been typed but not yet erased is still on screen
+        state = (self.committed(snapshot), snapshot["typos"] > snapshot["backspaces"])
+        if state == self._written or not self.enabled:
+            return
+        try:
+            with open(self._tmp_path, 'w') as f:
+                json.dump({
+                    "version": CHECKPOINT_VERSION,
+                    "text_hash": self.digest,
+                    "offset": state[0],
+                    "pending_typo": state[1],
+                    "rng_state": self.rng_state,
+                    "time": time.time(),
+                }, f)
+            os.replace(self._tmp_path, self.path)
+        except OSError as e:
+            # The checkpoint is a convenience; never let it stop the typing
+            self.enabled = False
+            print(f"{Fore.YELLOW}⚠ Cannot write checkpoint {self.path}, continuing without it: {e}{Style.RESET_ALL}")
+            return
+        self._written = state
+
+    def update(self, snapshot):
+        now = time.monotonic()
+        if now >= self._next_write:
+            self.write(snapshot)
+            self._next_write = now + self.interval
+
+    def close(self, snapshot):
+        if snapshot["state"] == "completed":
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+        else:
+            self.write(snapshot)
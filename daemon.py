@@ -0,0 +1,268 @@
+"""
+Jeeves - Human-like browser typing automation
+Daemon mode: accept typing jobs over a local Unix socket
+
+Protocol: newline-delimited JSON. Every request is one object with a
+"cmd" field and gets at least one JSON line back.
+
+    {"cmd": "submit", "job": {...}, "follow": true}
+        Queue a job (same fields as a batch manifest entry). Replies
+        {"ok": true, "job_id": ...}. With "follow", the connection then
+        receives "started", "progress" (telemetry snapshots) and "finished"
+        events for the job.
+    {"cmd": "status"}      Current job, queued job ids and pause state
+    {"cmd": "cancel"}      Cancel the current job, or {"job_id": ...} a queued one
+    {"cmd": "pause"}       Pause the current job before its next keystroke
+    {"cmd": "resume"}      Resume a paused job
+    {"cmd": "shutdown"}    Cancel everything and stop the daemon
+"""
+
+import itertools
+import json
+import os
+import queue
+import socket
+import socketserver
+import threading
+from colorama import Fore, Style
+
+from batch import run_job
+from telemetry import CallbackSink
+
+
+def default_socket_path():
+    """Per-user socket path, in $XDG_RUNTIME_DIR when available."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "jeeves.sock")
+    return f"/tmp/jeeves-{os.getuid()}.sock"
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("request must be a JSON object")
+            except ValueError as e:
+                self.send({"ok": False, "error": f"Invalid request: {e}"})
+                continue
+            if not self.server.jeeves_daemon.handle_request(request, self.send):
+                return
+
+    def send(self, message):
+        try:
+            self.wfile.write((json.dumps(message) + "\n").encode("utf-8"))
+            self.wfile.flush()
+            return True
+        except OSError:
+            return False  # Client went away
+
+
+class JeevesDaemon:
+    """
+    A long-lived owner of the keyboard that runs submitted jobs one at a time.
+
+    The Jeeves instance, its backend and its window handle stay initialised
+    between jobs, so a job starts typing without any startup latency.
+    """
+
+    def __init__(self, typer, socket_path=None):
+        self.typer = typer
+        self.socket_path = socket_path or default_socket_path()
+        self.base_config = typer.config
+        self.current_job = None
+        self._cancel_current = False  # Cancel requested for current_job, possibly before it started typing
+        self._queue = queue.Queue()
+        self._queued_ids = []
+        self._removed_ids = set()
+        self._subscribers = {}  # job_id -> [send callables]
+        self._lock = threading.Lock()
+        self._job_ids = itertools.count(1)
+        self._server = None
+
+    def handle_request(self, request, send):
+        """
+        Handle one protocol request.
+
+        Returns:
+            bool: False if the connection should be closed
+        """
+        cmd = request.get("cmd")
+        if cmd == "submit":
+            return self._submit(request, send)
+        if cmd == "status":
+            with self._lock:
+                current = self.current_job["id"] if self.current_job else None
+                send({"ok": True, "current": current, "queued": list(self._queued_ids),
+                      "paused": self.typer.paused})
+        elif cmd == "cancel":
+            send(self._cancel(request.get("job_id")))
+        elif cmd == "pause":
+            self.typer.pause()
+            send({"ok": True})
+        elif cmd == "resume":
+            self.typer.resume()
+            send({"ok": True})
+        elif cmd == "shutdown":
+            send({"ok": True})
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return False
+        else:
+            send({"ok": False, "error": f"Unknown command: {cmd}"})
+        return True
+
+    def _submit(self, request, send):
+        job = request.get("job")
+        if not isinstance(job, dict) or not ("text" in job or "file" in job):
+            send({"ok": False, "error": "A job needs a 'text' or 'file' field"})
+            return True
+        job = dict(job)
+        job["id"] = str(job.get("id", f"job-{next(self._job_ids)}"))
+        done = threading.Event()
+        with self._lock:
+            if job["id"] in self._queued_ids or (self.current_job and self.current_job["id"] == job["id"]):
+                send({"ok": False, "error": f"Job {job['id']} is already queued"})
+                return True
+            if request.get("follow"):
+                self._subscribers[job["id"]] = [send, done.set]
+            self._queued_ids.append(job["id"])
+            position = len(self._queued_ids)
+        send({"ok": True, "job_id": job["id"], "position": position})
+        self._queue.put(job)
+        if request.get("follow"):
+            done.wait()  # Keep the connection open while events are streamed to it
+        return True
+
+    def _cancel(self, job_id):
+        with self._lock:
+            if job_id is None or (self.current_job and self.current_job["id"] == job_id):
+                if not self.current_job:
+                    return {"ok": False, "error": "No job is running"}
+                self._cancel_current = True
+                self.typer.cancel()
+                return {"ok": True, "job_id": self.current_job["id"]}
+            if job_id not in self._queued_ids:
+                return {"ok": False, "error": f"Unknown job: {job_id}"}
+            self._queued_ids.remove(job_id)
+            self._removed_ids.add(job_id)
+        self._finish_unstarted(job_id)
+        return {"ok": True, "job_id": job_id}
+
+    def _finish_unstarted(self, job_id):
+        """Tell a follower that its job was dropped from the queue."""
+        self._publish(job_id, {"event": "finished", "job_id": job_id,
+                               "result": {"id": job_id, "status": "cancelled"}}, final=True)
+
+    def _publish(self, job_id, event, final=False):
+        with self._lock:
+            subscribers = self._subscribers.pop(job_id, None) if final else self._subscribers.get(job_id)
+        if subscribers:
+            send, done = subscribers
+            send(event)
+            if final:
+                done()
+
+    def _worker(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            with self._lock:
+                if job["id"] in self._removed_ids:
+                    self._removed_ids.discard(job["id"])
+                    continue
+                self._queued_ids.remove(job["id"])
+                self.current_job = job
+                self._cancel_current = False
+            job_id = job["id"]
+            self._publish(job_id, {"event": "started", "job_id": job_id})
+
+            def progress(snapshot):
+                # A cancel that arrived while the job was still loading found no run to stop;
+                # the first snapshot comes before the first keystroke, so stop the run now
+                if self._cancel_current:
+                    self.typer.cancel()
+                self._publish(job_id, dict(snapshot, event="progress", job_id=job_id))
+
+            sink = CallbackSink(progress)
+            self.typer.telemetry_sinks.append(sink)
+            self.typer.resume()  # A pause applies to the job it was issued for
+            try:
+                result = run_job(self.typer, job, self.base_config)
+            finally:
+                self.typer.telemetry_sinks.remove(sink)
+                self.typer.config = self.base_config
+                with self._lock:
+                    self.current_job = None
+            if self.typer.verbose:
+                color = Fore.GREEN if result["status"] == "ok" else Fore.RED
+                print(f"{color}• Job {job_id}: {result['status']} ({result['chars']} chars){Style.RESET_ALL}")
+            self._publish(job_id, {"event": "finished", "job_id": job_id, "result": result}, final=True)
+
+    def serve_forever(self):
+        """Listen on the socket and run jobs until shutdown() is called."""
+        if os.path.exists(self.socket_path):
+            # Refuse to steal the socket of a running daemon, but clean up a stale one
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.socket_path)
+                raise RuntimeError(f"Another daemon is already listening on {self.socket_path}")
+            except (ConnectionRefusedError, FileNotFoundError):
+                os.unlink(self.socket_path)
+            finally:
+                probe.close()
+
+        old_umask = os.umask(0o177)  # Socket readable and writable by this user only
+        try:
+            self._server = _Server(self.socket_path, _RequestHandler)
+        finally:
+            os.umask(old_umask)
+        self._server.jeeves_daemon = self
+
+        worker = threading.Thread(target=self._worker, name="jeeves-worker", daemon=True)
+        worker.start()
+        if self.typer.verbose:
+            print(f"{Fore.GREEN}✓ Jeeves daemon listening on {Fore.CYAN}{self.socket_path}{Style.RESET_ALL}")
+        try:
+            self._server.serve_forever()
+        finally:
+            self._queue.put(None)
+            self._server.server_close()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+    def shutdown(self):
+        """Cancel the running job, drop queued jobs and stop serving."""
+        with self._lock:
+            dropped = list(self._queued_ids)
+            self._removed_ids.update(dropped)
+            self._queued_ids.clear()
+        for job_id in dropped:
+            self._finish_unstarted(job_id)
+        self.typer.cancel()
+        if self._server:
+            self._server.shutdown()
+
+
+def send_request(request, socket_path=None):
+    """
+    Send one request to a running daemon.
+
+    Yields:
+        dict: Each reply line; for a followed submit this includes the job's events
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path or default_socket_path())
+        client.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        client.shutdown(socket.SHUT_WR)
+        with client.makefile("r", encoding="utf-8") as replies:
+            for line in replies:
+                yield json.loads(line)
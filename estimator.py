@@ -0,0 +1,144 @@
+"""
+Jeeves - Human-like browser typing automation
+Dry-run estimator: Monte Carlo distribution of a job's duration, typos and keystrokes
+"""
+
+import numpy as np
+from colorama import Fore, Style
+
+from backends import BACKENDS
+from keyboard_layout import get_nearby_keys
+from segmenter import paste_segments
+
+DEFAULT_RUNS = 10000
+EXACT_LIMIT = 2_000_000  # Draw every delay individually while runs * chars stays below this
+
+
+def text_statistics(text, layout="qwerty", charset=None):
+    """
+    Count what the keystroke model depends on, in one pass over the text.
+
+    Args:
+        text (str): The text to count
+        layout (str): Keyboard layout for the typo neighbours
+        charset (str): Regex character class body of what the backend can
+            type; only neighbours in it count as possible typos (None = any)
+
+    Returns:
+        dict: Characters, characters that can be mistyped and paragraph breaks
+    """
+    codes = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+    counts = np.bincount(codes) if len(codes) else np.zeros(0, dtype=np.int64)
+    present = np.flatnonzero(counts)
+    typable = sum(int(counts[code]) for code in present.tolist() if get_nearby_keys(chr(code), layout, charset))
+    newline = codes == 10
+    return {
+        "chars": len(codes),
+        "typable": typable,
+        "paragraphs": int(np.count_nonzero(newline[1:] & newline[:-1])),
+    }
+
+
+def _uniform_sums(rng, counts, low, high):
+    """Sums of `counts` U(low, high) draws, by moment-matched normal approximation."""
+    counts = np.asarray(counts, dtype=np.float64)
+    mean = counts * (low + high) / 2
+    std = np.sqrt(counts * (high - low) ** 2 / 12)
+    return np.clip(rng.normal(mean, std), counts * low, counts * high)
+
+
+def estimate_duration(text, config, runs=DEFAULT_RUNS, rng=None):
+    """
+    Simulate `runs` typing runs of `text` without injecting anything.
+
+    Uses the same model as build_keystroke_plan: a uniform delay per
+    character, thinking pauses, paragraph pauses and typos on characters
+    with neighbouring keys, each followed by a correction delay and a
+    backspace. Segments the configured backend would paste count as one
+    paste delay each. For small inputs every delay and pause duration is drawn
+    individually; for large ones the per-run counts are drawn from their
+    exact binomial distributions and the sums of uniform delays from their
+    normal approximation, so the cost does not grow with the input size.
+
+    Args:
+        text (str): The text to estimate
+        config (dict): A Jeeves configuration dictionary
+        runs (int): Number of simulated runs
+        rng (numpy.random.Generator): Source of randomness
+
+    Returns:
+        dict: Input statistics and, per simulated run, the duration (seconds),
+        typo count and keystroke count as arrays
+    """
+    speed = config["typing_speed"]
+    behavior = config["human_behavior"]
+    rng = rng if rng is not None else np.random.default_rng(config["engine"]["seed"])
+    charset = BACKENDS[config["engine"]["backend"]].charset
+    segments = paste_segments(text, config["paste"], charset)
+    typed = text
+    if segments:
+        bounds = [0] + [index for segment in segments for index in segment] + [len(text)]
+        typed = "".join(text[bounds[i]:bounds[i + 1]] for i in range(0, len(bounds), 2))
+    stats = text_statistics(typed, speed["keyboard_layout"], charset)
+    stats.update(chars=len(text), pasted=len(text) - len(typed), pastes=len(segments))
+    n = len(typed)
+
+    typos = rng.binomial(stats["typable"], speed["mistake_probability"], runs)
+    pauses = rng.binomial(n + len(segments), behavior["pause_probability"], runs)
+    if runs * n <= EXACT_LIMIT:
+        delays = rng.uniform(speed["min_delay"], speed["max_delay"], (runs, n)).sum(axis=1)
+        # The draws are i.i.d., so each run can take its first k as its k pauses
+        pause_draws = rng.uniform(behavior["min_pause_duration"], behavior["max_pause_duration"], (runs, n))
+        pause_time = np.where(np.arange(n) < pauses[:, None], pause_draws, 0.0).sum(axis=1)
+    else:
+        delays = _uniform_sums(rng, np.full(runs, n), speed["min_delay"], speed["max_delay"])
+        pause_time = _uniform_sums(rng, pauses, behavior["min_pause_duration"], behavior["max_pause_duration"])
+
+    durations = (delays + pause_time + stats["paragraphs"] * behavior["paragraph_pause"]
+                 + typos * speed["correction_delay"] + len(segments) * config["paste"]["paste_delay"])
+    return dict(stats, runs=runs, durations=durations, typos=typos, pauses=pauses,
+                keystrokes=n + 2 * typos + len(segments))
+
+
+def _format_duration(seconds):
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}"
+
+
+def print_estimate(text, config, runs=DEFAULT_RUNS):
+    """Estimate a job and print the ETA distribution, expected typos and keystrokes."""
+    import time
+    from speed_control import CHARS_PER_WORD
+
+    estimate = estimate_duration(text, config, runs)
+    p50, p90, p99 = np.percentile(estimate["durations"], [50, 90, 99])
+    typo_p50, typo_p99 = np.percentile(estimate["typos"], [50, 99])
+    mean = float(estimate["durations"].mean())
+    wpm = estimate["chars"] / CHARS_PER_WORD / (mean / 60) if mean > 0 else 0.0
+
+    print(f"{Fore.CYAN}Estimate over {estimate['runs']} simulated runs{Style.RESET_ALL}")
+    print(f"  {Fore.BLUE}• Characters: {Fore.CYAN}{estimate['chars']}{Fore.BLUE} "
+          f"({estimate['paragraphs']} paragraph breaks){Style.RESET_ALL}")
+    if estimate["pastes"]:
+        print(f"  {Fore.BLUE}• Pasted: {Fore.CYAN}{estimate['pasted']}{Fore.BLUE} characters in "
+              f"{estimate['pastes']} pastes{Style.RESET_ALL}")
+    print(f"  {Fore.BLUE}• Duration: {Fore.CYAN}{_format_duration(p50)}{Fore.BLUE} p50, "
+          f"{Fore.CYAN}{_format_duration(p90)}{Fore.BLUE} p90, "
+          f"{Fore.CYAN}{_format_duration(p99)}{Fore.BLUE} p99 (~{wpm:.0f} WPM){Style.RESET_ALL}")
+    print(f"  {Fore.BLUE}• Typos: {Fore.CYAN}{estimate['typos'].mean():.1f}{Fore.BLUE} expected "
+          f"({typo_p50:.0f} p50, {typo_p99:.0f} p99){Style.RESET_ALL}")
+    print(f"  {Fore.BLUE}• Keystrokes: {Fore.CYAN}{estimate['keystrokes'].mean():.0f}{Fore.BLUE} expected{Style.RESET_ALL}")
+    print(f"  {Fore.BLUE}• Thinking pauses: {Fore.CYAN}{estimate['pauses'].mean():.1f}{Fore.BLUE} expected{Style.RESET_ALL}")
+
+    # The speed controller overrides the natural pace, within its scaling limits
+    speed = config["typing_speed"]
+    if speed["finish_by"] is not None:
+        remaining = speed["finish_by"] - time.time()
+        print(f"{Fore.YELLOW}ℹ Pace controlled to finish by the deadline, in "
+              f"{_format_duration(max(remaining, 0))}{Style.RESET_ALL}")
+    elif speed["target_wpm"]:
+        target = estimate["chars"] / CHARS_PER_WORD / speed["target_wpm"] * 60
+        print(f"{Fore.YELLOW}ℹ Pace controlled to {speed['target_wpm']:g} WPM, about "
+              f"{_format_duration(target)}{Style.RESET_ALL}")
+    return estimate
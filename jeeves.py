@@ -5,15 +5,16 @@ Main entry point for the application
 """
 
 import argparse
+import os
 import sys
 import time
 import json
-from pathlib import Path
 import colorama
 from colorama import Fore, Style
 
 from typing_core import Jeeves
 from window_manager import list_browser_windows
+from backends import BACKENDS
 from utils import print_banner
 
 def create_default_config(file_path="typer_config.json"):
@@ -45,6 +46,17 @@ def create_default_config(file_path="typer_config.json"):
         print(f"{Fore.RED}✗ Failed to create default configuration: {e}{Style.RESET_ALL}")
         return False
 
+def countdown(seconds, quiet=False):
+    """Give the user time to focus the target window before typing starts."""
+    if quiet:
+        return
+    print(f"{Fore.YELLOW}⚠ Make sure the target window is ready to receive input!{Style.RESET_ALL}")
+    print(f"{Fore.GREEN}► Starting in {Fore.CYAN}{seconds}{Fore.GREEN} seconds...{Style.RESET_ALL}")
+    for i in range(seconds, 0, -1):
+        print(f"{Fore.CYAN}{i}...{Style.RESET_ALL}", end="\r", flush=True)
+        time.sleep(1)
+    print()  # New line after countdown
+
 def main():
     """Main function to parse arguments and run the program."""
     # Initialize colorama
@@ -62,9 +74,36 @@ def main():
   {Fore.GREEN}Type content from a specific file:{Style.RESET_ALL}
     python jeeves.py --file email.txt
   
+  {Fore.GREEN}Stream a huge file or piped text:{Style.RESET_ALL}
+    python jeeves.py --file transcript.txt --stream
+    generate_text | python jeeves.py --file -
+  
+  {Fore.GREEN}Continue a long file after an interruption:{Style.RESET_ALL}
+    python jeeves.py --file report.txt --resume
+  
+  {Fore.GREEN}Type at a steady 70 WPM, or finish within 20 minutes:{Style.RESET_ALL}
+    python jeeves.py --file essay.txt --target-wpm 70
+    python jeeves.py --file essay.txt --finish-by 20m
+  
+  {Fore.GREEN}Estimate how long a job will take without typing it:{Style.RESET_ALL}
+    python jeeves.py --file essay.txt --estimate
+  
   {Fore.GREEN}Type direct text:{Style.RESET_ALL}
     python jeeves.py --text "Hello, this is a test."
   
+  {Fore.GREEN}Type every job in a manifest in one session:{Style.RESET_ALL}
+    python jeeves.py --batch jobs.jsonl --results results.jsonl
+  
+  {Fore.GREEN}Type a manifest in parallel on several X displays (e.g. Xvfb :1 and Xvfb :2):{Style.RESET_ALL}
+    python jeeves.py --batch jobs.jsonl --displays :1,:2
+  
+  {Fore.GREEN}Run as a daemon that accepts jobs over a Unix socket:{Style.RESET_ALL}
+    python jeeves.py --serve --socket /tmp/jeeves.sock
+  
+  {Fore.GREEN}Record a timing trace and profile it:{Style.RESET_ALL}
+    python jeeves.py --file email.txt --trace run.trace
+    python jeeves.py --analyze-trace run.trace
+  
   {Fore.GREEN}List available windows:{Style.RESET_ALL}
     python jeeves.py --list-windows
   
@@ -83,8 +122,13 @@ def main():
     
     # Input options
     input_group = parser.add_argument_group(f"{Fore.CYAN}Input Options{Style.RESET_ALL}")
-    input_group.add_argument("-f", "--file", type=str, help="Path to text file to type")
+    input_group.add_argument("-f", "--file", type=str, help="Path to text file to type ('-' streams from stdin)")
     input_group.add_argument("-t", "--text", type=str, help="Direct text to type")
+    input_group.add_argument("--stream", action="store_true", help="Stream --file in chunks instead of loading it whole")
+    input_group.add_argument("--checkpoint", type=str, help="Checkpoint progress to this file (default: <file>.checkpoint for --file)")
+    input_group.add_argument("--estimate", type=int, nargs="?", const=10000, metavar="RUNS",
+                             help="Simulate RUNS typing runs (default 10000) and report the expected duration without typing")
+    input_group.add_argument("--resume", action="store_true", help="Continue an interrupted run from its checkpoint")
     
     # Configuration options
     config_group = parser.add_argument_group(f"{Fore.CYAN}Configuration Options{Style.RESET_ALL}")
@@ -103,10 +147,29 @@ def main():
     typing_group.add_argument("--min-delay", type=float, help="Minimum delay between keystrokes (seconds)")
     typing_group.add_argument("--max-delay", type=float, help="Maximum delay between keystrokes (seconds)")
     typing_group.add_argument("--mistake-rate", type=float, help="Probability of making typing mistakes (0.0-1.0)")
+    typing_group.add_argument("--target-wpm", type=float, help="Adjust the pace continuously to type at this many words per minute")
+    typing_group.add_argument("--finish-by", type=str, help="Adjust the pace to finish by a clock time (17:30) or within a duration (15m)")
+    typing_group.add_argument("--backend", type=str, choices=sorted(BACKENDS), help="Keystroke injection backend")
+    typing_group.add_argument("--seed", type=int, help="Random seed for a reproducible typing run")
+    
+    # Batch options
+    batch_group = parser.add_argument_group(f"{Fore.CYAN}Batch Options{Style.RESET_ALL}")
+    batch_group.add_argument("-b", "--batch", type=str, help="JSONL manifest of jobs to type in one session")
+    batch_group.add_argument("--results", type=str, help="Where to write per-job results (default: <manifest>.results.jsonl)")
+    batch_group.add_argument("--displays", type=str, help="Run the batch in parallel, one worker per X display (e.g. :1,:2,:3)")
+    
+    # Daemon options
+    daemon_group = parser.add_argument_group(f"{Fore.CYAN}Daemon Options{Style.RESET_ALL}")
+    daemon_group.add_argument("--serve", action="store_true", help="Run as a daemon accepting jobs over a Unix socket")
+    daemon_group.add_argument("--socket", type=str, help="Socket path for --serve (default: $XDG_RUNTIME_DIR/jeeves.sock)")
     
     # Other options
     other_group = parser.add_argument_group(f"{Fore.CYAN}Other Options{Style.RESET_ALL}")
     other_group.add_argument("-d", "--delay", type=int, default=3, help="Startup delay in seconds before typing begins")
+    other_group.add_argument("--status-file", type=str, help="Keep a JSON status file with progress, throughput and ETA")
+    other_group.add_argument("--events-fd", type=int, help="Write line-delimited JSON telemetry events to this file descriptor")
+    other_group.add_argument("--trace", type=str, help="Record a per-keystroke timing trace to this file")
+    other_group.add_argument("--analyze-trace", type=str, help="Print a profiling report for a recorded trace and exit")
     other_group.add_argument("-q", "--quiet", action="store_true", help="Quiet mode, minimal output")
     other_group.add_argument("-v", "--version", action="store_true", help="Show version information and exit")
     
@@ -118,10 +181,18 @@ def main():
     
     # Show version and exit
     if args.version:
-        import pyautogui
+        # Read __version__ from pyautogui's source: importing it (or importlib.metadata) is slow
+        import importlib.util
+        import re
+        spec = importlib.util.find_spec("pyautogui")
+        pyautogui_version = "not installed"
+        if spec and spec.origin:
+            with open(spec.origin, 'r', encoding='utf-8') as f:
+                match = re.search(r"""^__version__\s*=\s*['"]([^'"]+)['"]""", f.read(), re.MULTILINE)
+            pyautogui_version = match.group(1) if match else "unknown"
         print(f"{Fore.GREEN}Jeeves v1.0{Style.RESET_ALL}")
         print(f"{Fore.BLUE}Python Version: {sys.version.split()[0]}{Style.RESET_ALL}")
-        print(f"{Fore.BLUE}PyAutoGUI Version: {pyautogui.__version__}{Style.RESET_ALL}")
+        print(f"{Fore.BLUE}PyAutoGUI Version: {pyautogui_version}{Style.RESET_ALL}")
         return
     
     # Create default config if requested
@@ -129,6 +200,15 @@ def main():
         create_default_config(args.create_config)
         return
     
+    # Analyze a recorded trace if requested
+    if args.analyze_trace:
+        from keystroke_trace import print_trace_report
+        try:
+            print_trace_report(args.analyze_trace)
+        except Exception as e:
+            print(f"{Fore.RED}✗ Error reading trace: {e}{Style.RESET_ALL}")
+        return
+    
     # List windows if requested
     if args.list_windows:
         list_browser_windows()
@@ -153,18 +233,86 @@ def main():
     if args.mistake_rate is not None:
         typer.config["typing_speed"]["mistake_probability"] = args.mistake_rate
     
+    if args.target_wpm is not None:
+        typer.config["typing_speed"]["target_wpm"] = args.target_wpm
+    
+    if args.finish_by:
+        from speed_control import parse_finish_by
+        try:
+            typer.config["typing_speed"]["finish_by"] = parse_finish_by(args.finish_by)
+        except ValueError as e:
+            print(f"{Fore.RED}✗ {e}{Style.RESET_ALL}")
+            return
+    
+    if args.backend:
+        typer.config["engine"]["backend"] = args.backend
+    
+    if args.seed is not None:
+        typer.seed(args.seed)
+    
+    if args.status_file:
+        typer.config["engine"]["status_file"] = args.status_file
+    
+    if args.trace:
+        typer.config["engine"]["trace_file"] = args.trace
+    
+    if args.events_fd is not None:
+        typer.config["engine"]["events_fd"] = args.events_fd
+    
     # Save configuration if requested
     if args.save_config:
         typer.save_config(args.save_config)
-        if args.save_config and not (args.file or args.text):
+        if args.save_config and not (args.file or args.text or args.batch or args.serve):
             return  # Exit if only saving config
     
+    # Serve jobs over a socket if requested
+    if args.serve:
+        from daemon import JeevesDaemon
+        try:
+            JeevesDaemon(typer, args.socket).serve_forever()
+        except KeyboardInterrupt:
+            print(f"\n{Fore.YELLOW}ℹ Daemon stopped{Style.RESET_ALL}")
+        except Exception as e:
+            print(f"{Fore.RED}✗ Daemon error: {e}{Style.RESET_ALL}")
+        return
+    
+    # Run a batch of jobs if requested
+    if args.batch:
+        from batch import load_manifest, run_batch
+        try:
+            jobs = load_manifest(args.batch)
+        except Exception as e:
+            print(f"{Fore.RED}✗ Error reading manifest: {e}{Style.RESET_ALL}")
+            return
+        if not args.quiet:
+            print(f"{Fore.BLUE}ℹ Loaded {Fore.CYAN}{len(jobs)}{Fore.BLUE} jobs from {Fore.CYAN}{args.batch}{Style.RESET_ALL}")
+        results_path = args.results or os.path.splitext(args.batch)[0] + ".results.jsonl"
+        countdown(args.delay, args.quiet)
+        if args.displays:
+            from parallel import run_parallel
+            displays = [display.strip() for display in args.displays.split(",") if display.strip()]
+            run_parallel(typer, jobs, displays, results_path)
+        else:
+            run_batch(typer, jobs, results_path)
+        return
+    
     # Get text to type
     text_to_type = None
+    stream_input = None
     if args.text:
         text_to_type = args.text
         if not args.quiet:
             print(f"{Fore.BLUE}ℹ Using provided text ({len(text_to_type)} characters){Style.RESET_ALL}")
+    elif args.file and (args.stream or args.file == "-"):
+        from text_source import open_text_stream
+        try:
+            stream_input = open_text_stream(args.file)
+        except Exception as e:
+            print(f"{Fore.RED}✗ Error opening file: {e}{Style.RESET_ALL}")
+            return
+        if not args.quiet:
+            source = "standard input" if args.file == "-" else args.file
+            print(f"{Fore.BLUE}ℹ Streaming text from: {Fore.CYAN}{source}{Style.RESET_ALL}")
     elif args.file:
         try:
             with open(args.file, 'r', encoding='utf-8') as f:
@@ -186,21 +334,50 @@ def main():
             print(f"{Fore.YELLOW}ℹ Use --file or --text to specify what to type.{Style.RESET_ALL}")
             return
     
-    if not text_to_type:
+    if not text_to_type and stream_input is None:
         print(f"{Fore.RED}✗ No text to type. Exiting.{Style.RESET_ALL}")
         return
     
+    # Estimate instead of typing if requested
+    if args.estimate is not None:
+        from estimator import print_estimate
+        if stream_input is not None:
+            from text_source import iter_text_chunks, DEFAULT_CHUNK_SIZE
+            with stream_input[0] as stream:
+                text_to_type = "".join(iter_text_chunks(stream, DEFAULT_CHUNK_SIZE))
+        print_estimate(text_to_type, typer.config, max(args.estimate, 1))
+        return
+    
+    # Checkpoint whole-text runs so they can be resumed
+    if stream_input is not None:
+        if args.resume:
+            print(f"{Fore.RED}✗ --resume is not supported for streamed input{Style.RESET_ALL}")
+            return
+        if args.finish_by and stream_input[1] is None:
+            print(f"{Fore.RED}✗ --finish-by needs an input of known size, not a pipe{Style.RESET_ALL}")
+            return
+    elif args.checkpoint:
+        typer.config["engine"]["checkpoint_file"] = args.checkpoint
+    elif not args.text and not typer.config["engine"]["checkpoint_file"]:
+        typer.config["engine"]["checkpoint_file"] = f"{args.file or default_file}.checkpoint"
+    
     # Countdown
-    if not args.quiet:
-        print(f"{Fore.YELLOW}⚠ Make sure the target window is ready to receive input!{Style.RESET_ALL}")
-        print(f"{Fore.GREEN}► Starting in {Fore.CYAN}{args.delay}{Fore.GREEN} seconds...{Style.RESET_ALL}")
-        for i in range(args.delay, 0, -1):
-            print(f"{Fore.CYAN}{i}...{Style.RESET_ALL}", end="\r", flush=True)
-            time.sleep(1)
-        print()  # New line after countdown
+    countdown(args.delay, args.quiet)
     
     # Type the text
-    typer.type_with_realism(text_to_type)
+    if stream_input is not None:
+        stream, total_bytes = stream_input
+        with stream:
+            typer.type_stream(stream, total_bytes)
+    else:
+        try:
+            typer.type_with_realism(text_to_type, resume=args.resume)
+        except KeyboardInterrupt:
+            checkpoint_file = typer.config["engine"]["checkpoint_file"]
+            print(f"\n{Fore.YELLOW}⚠ Typing interrupted{Style.RESET_ALL}")
+            if checkpoint_file and os.path.exists(checkpoint_file):
+                print(f"{Fore.YELLOW}ℹ Progress saved to {Fore.CYAN}{checkpoint_file}{Fore.YELLOW}; "
+                      f"resume with --resume{Style.RESET_ALL}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,37 +1,170 @@
-def get_nearby_keys(char):
-    """Get keys that are physically near the given character on a QWERTY keyboard."""
-    keyboard_layout = {
-        'q': ['w', 'a', '1'],
-        'w': ['q', 'e', 'a', 's', '2'],
-        'e': ['w', 'r', 's', 'd', '3'],
-        'r': ['e', 't', 'd', 'f', '4'],
-        't': ['r', 'y', 'f', 'g', '5'],
-        'y': ['t', 'u', 'g', 'h', '6'],
-        'u': ['y', 'i', 'h', 'j', '7'],
-        'i': ['u', 'o', 'j', 'k', '8'],
-        'o': ['i', 'p', 'k', 'l', '9'],
-        'p': ['o', '[', 'l', ';', '0'],
-        'a': ['q', 'w', 's', 'z'],
-        's': ['w', 'e', 'a', 'd', 'z', 'x'],
-        'd': ['e', 'r', 's', 'f', 'x', 'c'],
-        'f': ['r', 't', 'd', 'g', 'c', 'v'],
-        'g': ['t', 'y', 'f', 'h', 'v', 'b'],
-        'h': ['y', 'u', 'g', 'j', 'b', 'n'],
-        'j': ['u', 'i', 'h', 'k', 'n', 'm'],
-        'k': ['i', 'o', 'j', 'l', 'm', ','],
-        'l': ['o', 'p', 'k', ';', ',', '.'],
-        'z': ['a', 's', 'x'],
-        'x': ['z', 's', 'd', 'c'],
-        'c': ['x', 'd', 'f', 'v'],
-        'v': ['c', 'f', 'g', 'b'],
-        'b': ['v', 'g', 'h', 'n'],
-        'n': ['b', 'h', 'j', 'm'],
-        'm': ['n', 'j', 'k', ','],
-        ' ': ['c', 'v', 'b', 'n', 'm']
-    }
-    
-    char = char.lower()
-    if char in keyboard_layout:
-        # match case of input character
-        return [key.upper() if char.isupper() else key for key in keyboard_layout[char]]
-    return []
\ No newline at end of file
+"""
+Jeeves - Human-like browser typing automation
+Keyboard geometry used to pick realistic typos
+
+Every layout is described by its rows of keys, each row as a pair of
+strings (unshifted, shifted) plus its horizontal stagger. Key coordinates
+are derived from that, and a neighbour index with distance-weighted
+cumulative tables is built once at import, so lookups and sampling never
+allocate.
+"""
+
+import re
+from bisect import bisect_right
+from math import hypot
+
+# Rows from the number row down: (x offset of the first key, unshifted keys, shifted keys)
+LAYOUTS = {
+    "qwerty": (
+        (0.0, "`1234567890-=", "~!@#$%^&*()_+"),
+        (1.5, "qwertyuiop[]\\", "QWERTYUIOP{}|"),
+        (1.75, "asdfghjkl;'", "ASDFGHJKL:\""),
+        (2.25, "zxcvbnm,./", "ZXCVBNM<>?"),
+    ),
+    "azerty": (
+        (0.0, "²&é\"'(-è_çà)=", "²1234567890°+"),
+        (1.5, "azertyuiop^$", "AZERTYUIOP¨£"),
+        (1.75, "qsdfghjklmù*", "QSDFGHJKLM%µ"),
+        (1.25, "<wxcvbn,;:!", ">WXCVBN?./§"),
+    ),
+    "qwertz": (
+        (0.0, "^1234567890ß´", "°!\"§$%&/()=?`"),
+        (1.5, "qwertzuiopü+", "QWERTZUIOPÜ*"),
+        (1.75, "asdfghjklöä#", "ASDFGHJKLÖÄ'"),
+        (1.25, "<yxcvbnm,.-", ">YXCVBNM;:_"),
+    ),
+    "dvorak": (
+        (0.0, "`1234567890[]", "~!@#$%^&*(){}"),
+        (1.5, "',.pyfgcrl/=\\", "\"<>PYFGCRL?+|"),
+        (1.75, "aoeuidhtns-", "AOEUIDHTNS_"),
+        (2.25, ";qjkxbmwvz", ":QJKXBMWVZ"),
+    ),
+}
+
+DEFAULT_LAYOUT = "qwerty"
+
+NEIGHBOUR_RADIUS = 1.6  # Keys further apart than this (in key widths) are never confused
+SPACE_BAR = (4.0, 8.5, 4.0)  # x start, x end and row of the space bar
+
+
+def _key_positions(rows):
+    """Map every unshifted key to its (x, y) centre and its shifted character."""
+    positions = {}
+    for y, (x_offset, unshifted, shifted) in enumerate(rows):
+        for x, (key, shifted_key) in enumerate(zip(unshifted, shifted)):
+            positions[key] = (x_offset + x, float(y), shifted_key)
+    return positions
+
+
+def _space_distance(x, y):
+    """Distance from a key centre to the nearest point of the space bar."""
+    start, end, row = SPACE_BAR
+    return hypot(max(start - x, 0.0, x - end), row - y)
+
+
+def _weighted(candidates):
+    """Turn (distance, key) pairs into (keys, cumulative weights), nearest first."""
+    candidates.sort()
+    keys = tuple(key for _, key in candidates)
+    cumulative = []
+    total = 0.0
+    for distance, _ in candidates:
+        total += 1.0 / (distance * distance)
+        cumulative.append(total)
+    return keys, tuple(weight / total for weight in cumulative)
+
+
+def _build_index(rows):
+    """Build {char: (neighbour keys, cumulative weights)} for one layout."""
+    positions = _key_positions(rows)
+    index = {}
+    for key, (x, y, shifted_key) in positions.items():
+        candidates = []
+        for other, (ox, oy, other_shifted) in positions.items():
+            distance = hypot(ox - x, oy - y)
+            if other != key and distance <= NEIGHBOUR_RADIUS:
+                candidates.append((distance, other))
+        keys, cumulative = _weighted(candidates)
+        index[key] = (keys, cumulative)
+        # A shifted character's typos are the shifted neighbours, keeping the shift held
+        if shifted_key != key:
+            index.setdefault(shifted_key, (tuple(positions[k][2] for k in keys), cumulative))
+
+    space_candidates = [
+        (distance, key) for key, (x, y, _) in positions.items()
+        if (distance := _space_distance(x, y)) <= 1.0
+    ]
+    index[" "] = _weighted(space_candidates)
+    return index
+
+
+_INDEX = {name: _build_index(rows) for name, rows in LAYOUTS.items()}
+_NO_NEIGHBOURS = ((), ())
+_TYPABLE_INDEX = {}  # (layout, charset) -> the layout's index without the keys outside charset
+
+
+def _restrict(index, charset):
+    """Drop the neighbours outside `charset` from an index, renormalizing the remaining weights."""
+    typable = re.compile(f"[{charset}]").fullmatch
+    restricted = {}
+    for char, (keys, cumulative) in index.items():
+        weights = [(key, high - low) for key, low, high in zip(keys, (0.0,) + cumulative, cumulative) if typable(key)]
+        total = sum(weight for _, weight in weights)
+        running = 0.0
+        kept_cumulative = []
+        for _, weight in weights:
+            running += weight
+            kept_cumulative.append(running / total)
+        restricted[char] = (tuple(key for key, _ in weights), tuple(kept_cumulative))
+    return restricted
+
+
+def _layout_index(layout, charset=None):
+    try:
+        index = _INDEX[layout]
+    except KeyError:
+        raise ValueError(f"Unknown keyboard layout '{layout}'. Available: {', '.join(LAYOUTS)}") from None
+    if charset is None:
+        return index
+    restricted = _TYPABLE_INDEX.get((layout, charset))
+    if restricted is None:
+        restricted = _TYPABLE_INDEX[(layout, charset)] = _restrict(index, charset)
+    return restricted
+
+
+def get_nearby_keys(char, layout=DEFAULT_LAYOUT, charset=None):
+    """
+    Get keys that are physically near the given character.
+
+    Shifted characters (capitals, symbols) return the shifted neighbours, so
+    the case of a typo matches the intended character.
+
+    Args:
+        char (str): The intended character
+        layout (str): Keyboard layout name, one of LAYOUTS
+        charset (str): Regex character class body of the keys a backend can
+            type; other neighbours are left out (None = keep all)
+
+    Returns:
+        tuple: Neighbouring characters, nearest first (empty if unknown)
+    """
+    return _layout_index(layout, charset).get(char, _NO_NEIGHBOURS)[0]
+
+
+def sample_nearby_key(char, u, layout=DEFAULT_LAYOUT, charset=None):
+    """
+    Pick a neighbouring key, weighted by inverse squared distance.
+
+    Args:
+        char (str): The intended character
+        u (float): A uniform random number in [0, 1)
+        layout (str): Keyboard layout name, one of LAYOUTS
+        charset (str): Only pick keys in this regex character class body (None = any)
+
+    Returns:
+        str: The typo character, or None if `char` has no neighbours
+    """
+    keys, cumulative = _layout_index(layout, charset).get(char, _NO_NEIGHBOURS)
+    if not keys:
+        return None
+    return keys[min(bisect_right(cumulative, u), len(keys) - 1)]
@@ -0,0 +1,180 @@
+"""
+Jeeves - Human-like browser typing automation
+Per-action trace recording and offline profiling report
+"""
+
+import json
+import math
+
+import numpy as np
+from colorama import Fore, Style
+
+from typing_plan import (ACTION_NAMES, ACTION_TYPE, ACTION_TYPO, ACTION_BACKSPACE, ACTION_PASTE, ACTION_BURST,
+                         ACTION_PAUSE, ACTION_PARAGRAPH)
+
+TRACE_DTYPE = np.dtype([
+    ("kind", np.uint8),  # Action code (see typing_plan.ACTION_NAMES)
+    ("planned", np.float64),  # Planned time from the start of the run (seconds)
+    ("actual", np.float64),  # Time the action actually started (NaN for pauses)
+    ("inject", np.float64),  # Duration of the backend call (seconds, 0 for pauses)
+])
+
+KEYSTROKE_KINDS = (ACTION_TYPE, ACTION_TYPO, ACTION_BACKSPACE, ACTION_PASTE, ACTION_BURST)
+
+
+class TraceRecorder:
+    """
+    Collect one row per action into a growable NumPy structured array.
+
+    Rows are appended with add(); save() writes them, plus metadata, to a
+    compact .npz file readable by load_trace().
+    """
+
+    def __init__(self, capacity=4096, meta=None):
+        self.rows = np.empty(capacity, dtype=TRACE_DTYPE)
+        self.size = 0
+        self.meta = dict(meta or {})
+
+    def add(self, kind, planned, actual, inject):
+        if self.size == len(self.rows):
+            self.rows = np.resize(self.rows, 2 * len(self.rows))
+        self.rows[self.size] = (kind, planned, actual, inject)
+        self.size += 1
+
+    def save(self, path):
+        """Write the recorded rows and metadata to `path`."""
+        with open(path, 'wb') as f:
+            np.savez(f, rows=self.rows[:self.size], meta=np.array(json.dumps(self.meta)))
+
+
+def load_trace(path):
+    """
+    Load a trace written by TraceRecorder.save().
+
+    Returns:
+        tuple: (structured rows array, metadata dict)
+    """
+    with np.load(path) as data:
+        return data["rows"], json.loads(str(data["meta"]))
+
+
+def _percentiles(values):
+    if len(values) == 0:
+        return {"p50": 0.0, "p90": 0.0, "p99": 0.0, "p99.9": 0.0, "max": 0.0}
+    p50, p90, p99, p999 = np.percentile(values, [50, 90, 99, 99.9])
+    return {"p50": float(p50), "p90": float(p90), "p99": float(p99),
+            "p99.9": float(p999), "max": float(values.max())}
+
+
+def _histogram(values, bins=12):
+    """Counts in log-spaced bins from 10 µs upward (values in seconds)."""
+    if len(values) == 0:
+        return []
+    low = 1e-5
+    high = max(float(values.max()), low * 10)
+    edges = np.concatenate(([0.0], np.logspace(math.log10(low), math.log10(high), bins)))
+    counts, edges = np.histogram(np.clip(values, 0.0, None), bins=edges)
+    return [(float(edges[i]), float(edges[i + 1]), int(counts[i])) for i in range(len(counts))]
+
+
+def analyze_trace(rows, worst=10):
+    """
+    Summarize a trace.
+
+    Args:
+        rows (numpy.ndarray): Trace rows (TRACE_DTYPE)
+        worst (int): How many of the worst stalls to report
+
+    Returns:
+        dict: Percentile tables, histograms, a time breakdown per category
+        and the worst stalls
+    """
+    kinds = rows["kind"]
+    keystroke = np.isin(kinds, KEYSTROKE_KINDS)
+    keys = rows[keystroke]
+    lateness = keys["actual"] - keys["planned"]
+    intervals = np.diff(keys["actual"])
+
+    # Planned time belongs to the action that starts it: a typing delay after a
+    # character, a correction delay after a typo, a pause until the next row.
+    # Injection calls run inside those delays, so the categories can overlap.
+    gaps = np.diff(rows["planned"], append=rows["planned"][-1] if len(rows) else 0.0)
+    breakdown = {
+        "typing delays": float(gaps[np.isin(kinds, (ACTION_TYPE, ACTION_BURST, ACTION_BACKSPACE))].sum()),
+        "typo corrections": float(gaps[kinds == ACTION_TYPO].sum()),
+        "pastes": float(gaps[kinds == ACTION_PASTE].sum()),
+        "thinking pauses": float(gaps[kinds == ACTION_PAUSE].sum()),
+        "paragraph pauses": float(gaps[kinds == ACTION_PARAGRAPH].sum()),
+        "injection calls": float(keys["inject"].sum()),
+        "behind schedule": float(max(lateness[-1], 0.0)) if len(lateness) else 0.0,
+    }
+
+    order = np.argsort(lateness)[::-1][:worst]
+    key_indices = np.flatnonzero(keystroke)
+    stalls = [{
+        "row": int(key_indices[i]),
+        "kind": ACTION_NAMES[int(keys["kind"][i])],
+        "planned": float(keys["planned"][i]),
+        "actual": float(keys["actual"][i]),
+        "late": float(lateness[i]),
+        "inject": float(keys["inject"][i]),
+    } for i in order]
+
+    return {
+        "rows": int(len(rows)),
+        "keystrokes": int(len(keys)),
+        "counts": {name: int(np.count_nonzero(kinds == code)) for code, name in enumerate(ACTION_NAMES)},
+        "planned_duration": float(keys["planned"][-1]) if len(keys) else 0.0,
+        "actual_duration": float(keys["actual"][-1] + keys["inject"][-1]) if len(keys) else 0.0,
+        "percentiles": {
+            "lateness": _percentiles(lateness),
+            "injection": _percentiles(keys["inject"]),
+            "interval": _percentiles(intervals),
+        },
+        "histograms": {
+            "lateness": _histogram(lateness),
+            "injection": _histogram(keys["inject"]),
+        },
+        "breakdown": breakdown,
+        "worst_stalls": stalls,
+    }
+
+
+def _ms(seconds):
+    return f"{seconds * 1000:9.3f}"
+
+
+def print_trace_report(path, worst=10):
+    """Load the trace at `path` and print a profiling report."""
+    rows, meta = load_trace(path)
+    report = analyze_trace(rows, worst)
+
+    print(f"{Fore.CYAN}Trace report: {Fore.WHITE}{path}{Style.RESET_ALL}")
+    if meta:
+        print(f"  {Fore.BLUE}• Backend: {Fore.CYAN}{meta.get('backend', '?')}{Style.RESET_ALL}")
+    print(f"  {Fore.BLUE}• Actions: {Fore.CYAN}{report['rows']}{Fore.BLUE} "
+          f"({', '.join(f'{n} {k}' for k, n in report['counts'].items())}){Style.RESET_ALL}")
+    print(f"  {Fore.BLUE}• Duration: {Fore.CYAN}{report['actual_duration']:.2f}s{Fore.BLUE} actual, "
+          f"{Fore.CYAN}{report['planned_duration']:.2f}s{Fore.BLUE} planned{Style.RESET_ALL}")
+
+    print(f"\n{Fore.YELLOW}{'Latency (ms)':<16}{'p50':>10}{'p90':>10}{'p99':>10}{'p99.9':>10}{'max':>10}{Style.RESET_ALL}")
+    for name, table in report["percentiles"].items():
+        print(f"{name:<16}" + "".join(f" {_ms(table[p])}" for p in ("p50", "p90", "p99", "p99.9", "max")))
+
+    for name, histogram in report["histograms"].items():
+        print(f"\n{Fore.YELLOW}{name.capitalize()} histogram{Style.RESET_ALL}")
+        peak = max((count for _, _, count in histogram), default=0) or 1
+        for low, high, count in histogram:
+            bar = "█" * int(round(40 * count / peak))
+            print(f"  {_ms(low)} - {_ms(high)} ms {count:>8} {Fore.CYAN}{bar}{Style.RESET_ALL}")
+
+    total = sum(report["breakdown"].values()) or 1.0
+    print(f"\n{Fore.YELLOW}{'Time breakdown':<20}{'seconds':>10}{'share':>9}{Style.RESET_ALL}")
+    for name, seconds in report["breakdown"].items():
+        print(f"{name:<20}{seconds:>10.3f}{100 * seconds / total:>8.1f}%")
+
+    print(f"\n{Fore.YELLOW}{'Worst stalls':<14}{'kind':>10}{'planned s':>12}{'late ms':>11}{'inject ms':>11}{Style.RESET_ALL}")
+    for stall in report["worst_stalls"]:
+        print(f"row {stall['row']:<10}{stall['kind']:>10}{stall['planned']:>12.3f}"
+              f"{_ms(stall['late']):>11}{_ms(stall['inject']):>11}")
+    return report
@@ -0,0 +1,142 @@
+"""
+Jeeves - Human-like browser typing automation
+Parallel mode: spread a batch of jobs over worker processes, one X display each
+"""
+
+import json
+import os
+import sys
+import time
+from colorama import Fore, Style
+
+# Per-worker state, set up by _init_worker in each worker process
+_typer = None
+_display = None
+_base_config = None  # The batch configuration, which every job's overrides apply to
+
+
+def _init_worker(config, displays):
+    """Bind this worker to the next free display and create its Jeeves instance."""
+    global _typer, _display, _base_config
+    _display = displays.get()
+    # Must happen before anything connects to X: pyautogui and Xlib read DISPLAY
+    os.environ["DISPLAY"] = _display
+
+    from typing_core import Jeeves
+    from window_manager import WindowRegistry, XlibWindowProvider
+
+    registry = WindowRegistry(XlibWindowProvider(_display)) if sys.platform.startswith("linux") else None
+    _typer = Jeeves(verbose=False, window_registry=registry)
+    _typer.config = _base_config = config
+
+
+def _run_worker_job(job):
+    from batch import run_job
+
+    try:
+        result = run_job(_typer, job, _base_config)
+    finally:
+        _typer.config = _base_config
+    result["display"] = _display
+    return result
+
+
+def check_display(display):
+    """
+    Check that an X display accepts connections.
+
+    Returns:
+        str: The error, or None if the display is usable
+    """
+    try:
+        from Xlib.display import Display
+        Display(display).close()
+        return None
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+
+
+def run_parallel(typer, jobs, displays, results_path=None):
+    """
+    Type the jobs of a batch concurrently, one worker process per X display.
+
+    Keyboard focus is per display, so each worker owns one display (e.g. its
+    own Xvfb server): it looks up its windows and injects keys there only,
+    with its own window registry and backend. Jobs are handed out from a
+    shared queue, so a worker that finishes early picks up the next job.
+
+    Args:
+        typer (Jeeves): A configured instance whose config is the base for every job
+        jobs (list): Jobs from load_manifest
+        displays (list): X display names, e.g. [":1", ":2"]
+        results_path (str): JSONL file receiving one result record per job
+
+    Returns:
+        list: The result records, in manifest order (empty if a display is unusable)
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    from concurrent.futures.process import BrokenProcessPool
+
+    if sys.platform.startswith("linux"):
+        errors = {display: check_display(display) for display in displays}
+        for display, error in errors.items():
+            if error:
+                print(f"{Fore.RED}✗ Cannot use display {display}: {error}{Style.RESET_ALL}")
+        if any(errors.values()):
+            return []
+
+    # Spawned workers start without inherited X connections or GUI modules
+    context = multiprocessing.get_context("spawn")
+    display_queue = context.Queue()
+    for display in displays:
+        display_queue.put(display)
+
+    results = [None] * len(jobs)
+    results_file = open(results_path, 'w', encoding='utf-8') if results_path else None
+    start = time.perf_counter()
+    try:
+        with ProcessPoolExecutor(max_workers=len(displays), mp_context=context,
+                                 initializer=_init_worker, initargs=(typer.config, display_queue)) as pool:
+            futures = {pool.submit(_run_worker_job, job): index for index, job in enumerate(jobs)}
+            for future in as_completed(futures):
+                index = futures[future]
+                job = jobs[index]
+                try:
+                    result = future.result()
+                except BrokenProcessPool as e:
+                    result = {"id": job["id"], "status": "failed", "chars": 0, "elapsed": 0.0,
+                              "typos": 0, "pauses": 0, "error": f"Worker died: {e}", "display": None}
+                results[index] = result
+                if results_file:
+                    results_file.write(json.dumps(result) + "\n")
+                    results_file.flush()
+                if result["status"] != "ok":
+                    print(f"{Fore.RED}✗ Job {job['id']} failed: {result['error']}{Style.RESET_ALL}")
+                elif typer.verbose:
+                    print(f"{Fore.GREEN}✓ Job {job['id']} on {result['display']}: "
+                          f"{result['chars']} chars in {result['elapsed']:.2f}s{Style.RESET_ALL}")
+    finally:
+        if results_file:
+            results_file.close()
+    wall = time.perf_counter() - start
+
+    if typer.verbose:
+        done = [r for r in results if r is not None]
+        chars = sum(r["chars"] for r in done)
+        print(f"\n{Fore.GREEN}✓ Parallel batch finished{Style.RESET_ALL}")
+        print(f"  {Fore.BLUE}• Jobs succeeded: {Fore.CYAN}{sum(1 for r in done if r['status'] == 'ok')}/{len(jobs)}"
+              f"{Style.RESET_ALL}")
+        print(f"  {Fore.BLUE}• Characters typed: {Fore.CYAN}{chars}{Style.RESET_ALL}")
+        print(f"  {Fore.BLUE}• Total time: {Fore.CYAN}{wall:.2f}s{Style.RESET_ALL}")
+        print(f"  {Fore.BLUE}• Aggregate throughput: {Fore.CYAN}{chars / (wall or 1):.2f}{Fore.BLUE} chars/sec"
+              f"{Style.RESET_ALL}")
+        for display in displays:
+            mine = [r for r in done if r.get("display") == display]
+            busy = sum(r["elapsed"] for r in mine)
+            print(f"  {Fore.BLUE}• {display}: {Fore.CYAN}{len(mine)}{Fore.BLUE} jobs, "
+                  f"{sum(r['chars'] for r in mine)} chars, busy {busy:.2f}s ({100 * busy / (wall or 1):.0f}%)"
+                  f"{Style.RESET_ALL}")
+        if results_path:
+            print(f"  {Fore.BLUE}• Results written to: {Fore.CYAN}{results_path}{Style.RESET_ALL}")
+    return results
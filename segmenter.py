@@ -0,0 +1,59 @@
+"""
+Jeeves - Human-like browser typing automation
+Segmentation: decide which runs of text are pasted instead of typed
+"""
+
+import re
+
+_WHITESPACE = r" \t\n\r"
+
+
+def _untypeable_spans(text, charset):
+    """Whole words containing a character outside `charset` (a regex character class body)."""
+    # Words are only tried from their start and their typeable prefix is never backtracked into, so
+    # this stays linear; the second branch catches untypeable runs that start at whitespace
+    word = re.compile(rf"(?<![^{_WHITESPACE}])(?:(?![{_WHITESPACE}])[{charset}])*+[^{charset}]\S*"
+                      rf"|[^{charset}]+\S*")
+    return [match.span() for match in word.finditer(text)]
+
+
+def paste_segments(text, rules, charset=None):
+    """
+    Find the runs of `text` that should be pasted through the clipboard.
+
+    A run is pasted if it matches one of the rules' regular expressions
+    ("patterns"), if it is a whitespace-free run of at least
+    "min_run_length" characters (URLs, hashes, encoded data), or, with
+    "untypeable", if it is a word containing a character the backend
+    cannot type. Overlapping and touching runs are merged.
+
+    Text that is typed in chunks is segmented per chunk, so a run that
+    spans a chunk boundary becomes two pastes.
+
+    Args:
+        text (str): The text to segment
+        rules (dict): The "paste" section of a Jeeves configuration
+        charset (str): Regex character class body of the characters the
+            backend can type, None if it can type anything
+
+    Returns:
+        list: Sorted, non-overlapping (start, end) index pairs
+    """
+    spans = []
+    for pattern in rules["patterns"]:
+        spans.extend(match.span() for match in re.finditer(pattern, text) if match.end() > match.start())
+    if rules["min_run_length"]:
+        spans.extend(match.span() for match in re.finditer(rf"\S{{{int(rules['min_run_length'])},}}", text))
+    if rules["untypeable"] and charset is not None:
+        spans.extend(_untypeable_spans(text, charset))
+    if not spans:
+        return []
+
+    spans.sort()
+    merged = [list(spans[0])]
+    for start, end in spans[1:]:
+        if start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return [tuple(span) for span in merged]
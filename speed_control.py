@@ -0,0 +1,131 @@
+"""
+Jeeves - Human-like browser typing automation
+Closed-loop speed control: hit a target WPM or a finish-by deadline
+"""
+
+import time
+
+CHARS_PER_WORD = 5  # The standard definition of a "word" for WPM
+HORIZON = 5.0  # Seconds over which a WPM shortfall or lead is corrected
+SMOOTHING = 0.5  # Weight of each new scale estimate (1 = no smoothing)
+MIN_SCALE = 0.05  # Never compress the planned timeline more than 20x...
+MAX_SCALE = 20.0  # ...or stretch it more than 20x
+
+
+class SpeedController:
+    """
+    Steer the typing rate towards a target by rescaling the scheduler's timeline.
+
+    Every delay, correction and pause of the plan is stretched or
+    compressed by the same factor, so the random variation between
+    keystrokes is kept while the average rate moves. The factor combines a
+    feed-forward term, the plan's own rate (which already reflects the
+    text's typos, pauses and paragraphs), with feedback on the measured
+    progress: a job that falls behind, e.g. because the backend is slow,
+    speeds up until it has caught up.
+
+    With `finish_by`, the rate needed to type the remaining text before the
+    deadline is recomputed on every update. Otherwise `target_wpm` is held,
+    and any progress error is made up over the next HORIZON seconds.
+
+    Args:
+        scheduler (PrecisionScheduler): The running scheduler to rescale
+        target_wpm (float): Target words per minute
+        finish_by (float): Deadline as a time.time() timestamp
+        total (int): Size of the input in progress units (chars or bytes)
+        interval (float): Time between updates (seconds)
+    """
+
+    def __init__(self, scheduler, target_wpm=None, finish_by=None, total=None, interval=1.0):
+        if finish_by is not None and total is None:
+            raise ValueError("A finish-by deadline needs an input of known size")
+        if finish_by is None and not target_wpm:
+            raise ValueError("Either a target WPM or a finish-by deadline is required")
+        self.scheduler = scheduler
+        self.target_rate = target_wpm * CHARS_PER_WORD / 60 if target_wpm else None
+        self.finish_by = finish_by
+        self.total = total
+        self.interval = interval
+        self.deadline = None
+        self.planned_chars = 0
+        self.planned_duration = 0.0
+
+    def plan(self, chars, duration):
+        """Account for a newly planned chunk of `chars` characters lasting `duration` seconds at scale 1."""
+        self.planned_chars += chars
+        self.planned_duration += duration
+
+    def start(self, now, offset=0.0):
+        """
+        Apply the feed-forward scale for the first planned chunk.
+
+        Returns:
+            float: perf_counter time of the first update
+        """
+        if self.finish_by is not None:
+            self.deadline = now + (self.finish_by - time.time())
+        return self.update(now, offset, 0, 0)
+
+    def required_rate(self, now, progress, chars):
+        """Characters per second needed from now on to stay on target."""
+        if self.deadline is None:
+            behind = self.target_rate * self.scheduler.elapsed() - chars
+            return max(self.target_rate + behind / HORIZON, 0.1 * self.target_rate)
+        # Progress may be in bytes; convert what is left using the ratio seen so far
+        units_per_char = progress / chars if chars else 1.0
+        remaining = max(self.total - progress, 0) / units_per_char
+        return remaining / max(self.deadline - now, 1e-3)
+
+    def update(self, now, offset, progress, chars):
+        """
+        Rescale the timeline from `offset` on to steer towards the target.
+
+        Args:
+            now (float): Current perf_counter time
+            offset (float): Planned offset of the action about to happen
+            progress (int): Progress so far, in the units of `total`
+            chars (int): Characters typed so far
+
+        Returns:
+            float: perf_counter time of the next update
+        """
+        if self.planned_duration > 0:
+            planned_rate = self.planned_chars / self.planned_duration
+            rate = self.required_rate(now, progress, chars)
+            target = min(max(planned_rate / rate, MIN_SCALE), MAX_SCALE) if rate > 0 else MAX_SCALE
+            scale = self.scheduler.scale + SMOOTHING * (target - self.scheduler.scale) if chars else target
+            self.scheduler.rescale(scale, offset)
+        return now + self.interval
+
+
+def parse_finish_by(value, now=None):
+    """
+    Parse a finish-by time given on the command line.
+
+    Accepts a clock time ("17:30" or "17:30:15", the next time it occurs)
+    or a duration from now ("90s", "15m", "2h", "1h30m").
+
+    Returns:
+        float: The deadline as a time.time() timestamp
+    """
+    import datetime
+    import re
+
+    now = time.time() if now is None else now
+    match = re.fullmatch(r"(\d{1,2}):(\d{2})(?::(\d{2}))?", value.strip())
+    if match:
+        hour, minute, second = (int(part or 0) for part in match.groups())
+        current = datetime.datetime.fromtimestamp(now)
+        try:
+            deadline = current.replace(hour=hour, minute=minute, second=second, microsecond=0)
+        except ValueError:
+            raise ValueError(f"Invalid clock time '{value}'") from None
+        if deadline.timestamp() <= now:
+            deadline += datetime.timedelta(days=1)
+        return deadline.timestamp()
+
+    parts = re.findall(r"(\d+(?:\.\d+)?)([hms])", value.strip())
+    if not parts or "".join(number + unit for number, unit in parts) != value.strip():
+        raise ValueError(f"Invalid finish-by time '{value}' (use e.g. 17:30 or 15m)")
+    seconds = {"h": 3600, "m": 60, "s": 1}
+    return now + sum(float(number) * seconds[unit] for number, unit in parts)
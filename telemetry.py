@@ -0,0 +1,200 @@
+"""
+Jeeves - Human-like browser typing automation
+Run telemetry: cheap counters in the typing loop, rate-limited reporting to sinks
+"""
+
+import json
+import os
+import time
+
+from typing_plan import (ACTION_NAMES, ACTION_TYPE, ACTION_TYPO, ACTION_BACKSPACE, ACTION_PASTE, ACTION_PAUSE,
+                         ACTION_PARAGRAPH)
+
+
+class Telemetry:
+    """
+    Counters for one typing run, reported to sinks at most every `interval` seconds.
+
+    The typing loop only bumps `counts[action]`, `progress` and `pasted`
+    (plain list and attribute writes); everything else, including reading the
+    scheduler's lag and any I/O, happens in emit().
+
+    Args:
+        total (int): Expected progress total (chars or bytes), None if unknown
+        unit (str): Progress unit, "chars" or "bytes"
+        interval (float): Minimum time between emits (seconds)
+        sinks (list): Objects with update(snapshot) and close(snapshot)
+        scheduler (PrecisionScheduler): Source of scheduling lag measurements
+    """
+
+    def __init__(self, total=None, unit="chars", interval=0.25, sinks=(), scheduler=None):
+        self.total = total
+        self.unit = unit
+        self.interval = interval
+        self.sinks = list(sinks)
+        self.scheduler = scheduler
+        self.counts = [0] * len(ACTION_NAMES)  # Indexed by action code
+        self.progress = 0  # Chars or bytes delivered
+        self.pasted = 0  # Chars delivered by pasting
+        self.started = None
+        self.lag_mean = 0.0
+        self.lag_max = 0.0
+
+    @property
+    def chars(self):
+        """Characters of the text delivered, typed or pasted."""
+        return self.counts[ACTION_TYPE] + self.pasted
+
+    @property
+    def typos(self):
+        return self.counts[ACTION_TYPO]
+
+    @property
+    def backspaces(self):
+        return self.counts[ACTION_BACKSPACE]
+
+    @property
+    def pastes(self):
+        return self.counts[ACTION_PASTE]
+
+    @property
+    def pauses(self):
+        return self.counts[ACTION_PAUSE]
+
+    def start(self, now=None):
+        """
+        Mark the start of typing and report it.
+
+        Returns:
+            float: perf_counter time of the next emit
+        """
+        self.started = time.perf_counter() if now is None else now
+        return self.emit(self.started)
+
+    def _collect_lag(self):
+        if self.scheduler is None:
+            return
+        _, self.lag_mean, self.lag_max = self.scheduler.summary()
+
+    def snapshot(self, now=None, state="running"):
+        """Current counters, rates and ETA as a JSON-serializable dict."""
+        now = time.perf_counter() if now is None else now
+        self._collect_lag()
+        elapsed = now - self.started if self.started is not None else 0.0
+        rate = self.progress / elapsed if elapsed > 0 else 0.0
+        eta = None
+        if self.total is not None and rate > 0:
+            eta = max(self.total - self.progress, 0) / rate
+        return {
+            "state": state,
+            "time": time.time(),
+            "elapsed": round(elapsed, 3),
+            "progress": self.progress,
+            "total": self.total,
+            "unit": self.unit,
+            "rate": round(rate, 3),
+            "eta": None if eta is None else round(eta, 3),
+            "chars": self.chars,
+            "typos": self.typos,
+            "backspaces": self.backspaces,
+            "pastes": self.pastes,
+            "pasted": self.pasted,
+            "pauses": self.pauses,
+            "paragraphs": self.counts[ACTION_PARAGRAPH],
+            "lag_mean": round(self.lag_mean, 6),
+            "lag_max": round(self.lag_max, 6),
+        }
+
+    def emit(self, now, state="running"):
+        """
+        Send a snapshot to every sink.
+
+        Returns:
+            float: perf_counter time of the next emit
+        """
+        if self.sinks:
+            snapshot = self.snapshot(now, state)
+            for sink in self.sinks:
+                sink.update(snapshot)
+        return now + self.interval
+
+    def finish(self, state="completed"):
+        """Send the final snapshot and close every sink."""
+        snapshot = self.snapshot(state=state)
+        for sink in self.sinks:
+            sink.update(snapshot)
+            sink.close(snapshot)
+        return snapshot
+
+
+class ConsoleSink:
+    """A tqdm progress bar refreshed only when telemetry emits."""
+
+    def __init__(self, total=None, unit="chars", enabled=True):
+        from tqdm import tqdm
+
+        if unit == "bytes":
+            options = {"unit": "B", "unit_scale": True, "unit_divisor": 1024}
+            if total is None:
+                options["bar_format"] = "{desc}: {n_fmt}B [{elapsed}, {rate_fmt}]"
+        else:
+            options = {"unit": "chars"}
+        if total is not None:
+            options["bar_format"] = "{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]"
+        self.pbar = tqdm(total=total, desc="Typing progress", disable=not enabled,
+                         mininterval=0, **options)
+
+    def update(self, snapshot):
+        self.pbar.update(snapshot["progress"] - self.pbar.n)
+
+    def close(self, snapshot):
+        self.pbar.close()
+
+
+class StatusFileSink:
+    """Keep a JSON status file up to date, replacing it atomically on every emit."""
+
+    def __init__(self, path):
+        self.path = path
+        self._tmp_path = f"{path}.tmp"
+
+    def update(self, snapshot):
+        with open(self._tmp_path, 'w') as f:
+            json.dump(snapshot, f)
+        os.replace(self._tmp_path, self.path)
+
+    def close(self, snapshot):
+        pass
+
+
+class EventStreamSink:
+    """Write every snapshot as one JSON line to a file descriptor or file object."""
+
+    def __init__(self, target):
+        if isinstance(target, int):
+            self.stream = os.fdopen(target, 'w', buffering=1, closefd=False)
+        else:
+            self.stream = target
+
+    def update(self, snapshot):
+        try:
+            self.stream.write(json.dumps(snapshot) + "\n")
+            self.stream.flush()
+        except (OSError, ValueError):
+            pass  # Reader went away; typing must not fail because of monitoring
+
+    def close(self, snapshot):
+        pass
+
+
+class CallbackSink:
+    """Hand every snapshot to a callable, e.g. to forward it over a socket."""
+
+    def __init__(self, callback):
+        self.callback = callback
+
+    def update(self, snapshot):
+        self.callback(snapshot)
+
+    def close(self, snapshot):
+        pass
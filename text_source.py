@@ -0,0 +1,73 @@
+"""
+Jeeves - Human-like browser typing automation
+Streaming text input from files, pipes and stdin
+"""
+
+import codecs
+import os
+import stat
+import sys
+
+DEFAULT_CHUNK_SIZE = 16384  # Bytes read per chunk when streaming
+
+
+def open_text_stream(path):
+    """
+    Open a file, named pipe or stdin ('-') for streaming.
+
+    Args:
+        path (str): Path to read, or '-' for standard input
+
+    Returns:
+        tuple: (binary stream, total size in bytes or None if unknown)
+    """
+    if path == "-":
+        stream = sys.stdin.buffer
+    else:
+        stream = open(path, "rb")
+    try:
+        info = os.fstat(stream.fileno())
+        total_bytes = info.st_size if stat.S_ISREG(info.st_mode) else None
+    except (OSError, ValueError):
+        total_bytes = None
+    return stream, total_bytes
+
+
+def iter_text_chunks(stream, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Decode a binary stream as UTF-8 in bounded chunks.
+
+    Uses `read1` when available so data from a live pipe is handed over as
+    soon as it arrives instead of waiting for a full chunk. Multi-byte
+    characters split across reads are reassembled by an incremental decoder.
+
+    Args:
+        stream: A binary file-like object
+        chunk_size (int): Maximum number of bytes to read at once
+
+    Yields:
+        str: Decoded text, never split inside a character
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    read = getattr(stream, "read1", stream.read)
+    while True:
+        data = read(chunk_size)
+        if not data:
+            break
+        text = decoder.decode(data)
+        if text:
+            yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def char_byte_lengths(text):
+    """
+    UTF-8 encoded length of every character in `text`, as a list.
+
+    Used to drive byte-based progress while typing a stream.
+    """
+    import numpy as np
+    codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+    return (1 + (codes >= 0x80) + (codes >= 0x800) + (codes >= 0x10000)).tolist()
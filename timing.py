@@ -0,0 +1,186 @@
+"""
+Jeeves - Human-like browser typing automation
+High-precision timing: absolute deadlines with a hybrid sleep-then-spin wait
+"""
+
+import time
+from array import array
+
+import numpy as np
+
+ERROR_BUFFER = 65536  # Errors kept individually before they are folded into the running summary
+# Histogram bins for the percentiles of long runs: negative errors, then 200 log-spaced bins per
+# decade from 0.1 us to 100 s (about 1% resolution), then everything above
+_ERROR_EDGES = np.concatenate(([0.0], np.logspace(-7, 2, 1801)))
+
+
+class PrecisionScheduler:
+    """
+    Wait for absolute deadlines measured from a fixed start time.
+
+    Because every deadline is absolute, injection latency and sleep
+    overshoot on one keystroke are absorbed by the next wait instead of
+    accumulating. The bulk of each wait is a regular sleep; the last
+    `spin_threshold` seconds are spent busy-waiting on perf_counter, which
+    gives sub-millisecond accuracy at the cost of a little CPU.
+
+    If an `interrupt` event is given, the sleeping part of a wait returns
+    early as soon as the event is set, so long pauses can be cut short by
+    another thread.
+
+    The timeline can be stretched or compressed while running with
+    rescale(); planned offsets are then mapped to deadlines as
+    start_time + scale * offset.
+
+    Recorded timing errors are buffered and, every ERROR_BUFFER actions,
+    folded into a running summary (count, mean, M2, maximum and a
+    histogram), so memory stays bounded however long the run is. Runs that
+    never fill the buffer get exact percentiles.
+    """
+
+    def __init__(self, spin_threshold=0.002, interrupt=None):
+        self.spin_threshold = spin_threshold
+        self.interrupt = interrupt
+        self.start_time = None
+        self.origin = None  # When the run started, moved forward by shift()
+        self.scale = 1.0
+        self._reset_errors()
+
+    def start(self):
+        """Anchor offset 0 at the current time."""
+        self.start_time = self.origin = time.perf_counter()
+        self.scale = 1.0
+        self._reset_errors()
+
+    def _reset_errors(self):
+        self.errors = array('d')  # Achieved minus planned time of the recorded actions not yet folded
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._max = -np.inf
+        self._histogram = np.zeros(len(_ERROR_EDGES) + 1, dtype=np.int64)
+
+    def shift(self, seconds):
+        """Push every future deadline back by `seconds` (e.g. after an interruption)."""
+        self.start_time += seconds
+        self.origin += seconds
+
+    def rescale(self, scale, offset):
+        """
+        Stretch the timeline after `offset` by `scale` relative to the plan.
+
+        The deadline of `offset` itself stays where it is, so the schedule
+        remains continuous.
+        """
+        self.start_time += (self.scale - scale) * offset
+        self.scale = scale
+
+    def deadline(self, offset):
+        """The perf_counter time at which `offset` is due."""
+        return self.start_time + self.scale * offset
+
+    def elapsed(self):
+        """Seconds since the scheduler was started, not counting shifts."""
+        return time.perf_counter() - self.origin
+
+    def wait_until(self, offset):
+        """
+        Block until `offset` seconds after the start time.
+
+        Args:
+            offset (float): Planned time of the next action
+
+        Returns:
+            float: The perf_counter value at which the wait ended (early if interrupted)
+        """
+        deadline = self.start_time + self.scale * offset
+        now = time.perf_counter()
+        remaining = deadline - now
+        if remaining > self.spin_threshold:
+            if self.interrupt is None:
+                time.sleep(remaining - self.spin_threshold)
+            elif self.interrupt.wait(remaining - self.spin_threshold):
+                return time.perf_counter()
+            now = time.perf_counter()
+        while now < deadline:
+            now = time.perf_counter()
+        return now
+
+    def record(self, offset, actual):
+        """Record how far the action planned for `offset` actually happened from it."""
+        errors = self.errors
+        errors.append(actual - self.start_time - self.scale * offset)
+        if len(errors) >= ERROR_BUFFER:
+            self._fold()
+
+    def _fold(self):
+        """Merge the buffered errors into the running summary and empty the buffer."""
+        errors = np.frombuffer(self.errors, dtype=np.float64)
+        if len(errors):
+            # Chan et al.'s pairwise update of the mean and M2
+            count = self._count + len(errors)
+            mean = float(errors.mean())
+            delta = mean - self._mean
+            self._m2 += float(((errors - mean) ** 2).sum()) + delta * delta * self._count * len(errors) / count
+            self._mean += delta * len(errors) / count
+            self._count = count
+            self._max = max(self._max, float(errors.max()))
+            self._histogram += np.bincount(np.searchsorted(_ERROR_EDGES, errors, side='right'),
+                                           minlength=len(self._histogram))
+        self.errors = array('d')
+
+    def summary(self):
+        """
+        Count, mean and maximum of the error so far, cheap enough to call while running.
+
+        Returns:
+            tuple: (count, mean, max) in seconds
+        """
+        errors = np.frombuffer(self.errors, dtype=np.float64)
+        count = self._count + len(errors)
+        if not count:
+            return 0, 0.0, 0.0
+        total = self._mean * self._count + float(errors.sum())
+        maximum = max(self._max, float(errors.max())) if len(errors) else self._max
+        return count, total / count, maximum
+
+    def _percentile(self, q):
+        """Upper edge of the histogram bin holding the q-th percentile, capped at the maximum."""
+        cumulative = np.cumsum(self._histogram)
+        index = int(np.searchsorted(cumulative, q / 100 * cumulative[-1]))
+        if index == 0:
+            return 0.0  # Among the negative errors (actions a hair early)
+        if index >= len(_ERROR_EDGES):
+            return self._max
+        return min(float(_ERROR_EDGES[index]), self._max)
+
+    def stats(self):
+        """
+        Summarize the recorded timing error.
+
+        Returns:
+            dict: Count, mean, standard deviation (jitter), median, p99 and
+            maximum of the error in seconds
+        """
+        if not self._count:
+            if not self.errors:
+                return {"count": 0, "mean": 0.0, "jitter": 0.0, "p50": 0.0, "p99": 0.0, "max": 0.0}
+            errors = np.frombuffer(self.errors, dtype=np.float64)
+            p50, p99 = np.percentile(errors, [50, 99])
+            return {
+                "count": len(errors),
+                "mean": float(errors.mean()),
+                "jitter": float(errors.std()),
+                "p50": float(p50),
+                "p99": float(p99),
+                "max": float(errors.max()),
+            }
+        self._fold()
+        return {
+            "count": self._count,
+            "mean": self._mean,
+            "jitter": (self._m2 / self._count) ** 0.5,
+            "p50": self._percentile(50),
+            "p99": self._percentile(99),
+            "max": self._max,
+        }
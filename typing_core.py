@@ -3,17 +3,23 @@ Jeeves - Human-like browser typing automation
 Core typing functionality and config management
 """
 
+import copy
 import json
 import os
-import random
+import threading
 import time
-import pyautogui
-from tqdm import tqdm
 import colorama
 from colorama import Fore, Style
 
-from window_manager import find_browser_window
-from keyboard_layout import get_nearby_keys
+from backends import create_backend
+
+# NumPy, tqdm and the window/GUI stack are imported where they are used so
+# that config-only invocations of the CLI start quickly and work headless.
+
+# Waits the typing loop asks its driver for, besides keystroke deadlines
+_SLEEP = "sleep"  # (_SLEEP, seconds): wait a fixed time
+_RESUME = "resume"  # (_RESUME, None): wait until the run is resumed
+ASYNC_POLL_INTERVAL = 0.05  # Longest asyncio sleep before re-checking for pause and cancel (seconds)
 
 
 class Jeeves:
@@ -25,6 +31,9 @@ class Jeeves:
             "max_delay": 0.15,  # Maximum delay between keystrokes (seconds)
             "mistake_probability": 0.03,  # Probability of making a typo
             "correction_delay": 0.5,  # Delay before correcting a typo (seconds)
+            "keyboard_layout": "qwerty",  # Layout used to pick typos: qwerty, azerty, qwertz or dvorak
+            "target_wpm": None,  # Steer the delays and pauses towards this many words per minute (None = off)
+            "finish_by": None,  # Steer the speed to finish by this Unix timestamp (overrides target_wpm)
         },
         "human_behavior": {
             "pause_probability": 0.1,  # Probability of taking a pause while typing
@@ -36,24 +45,108 @@ class Jeeves:
             "window_title": "Chrome",  # Window title to search for
             "focus_delay": 1.0,  # Delay after focusing the window (seconds)
             "window_index": 0,  # Which window to use if multiple are found (0 = first)
+            "match_mode": "substring",  # How window_title is matched: substring, exact or regex
+            "focus_check_interval": 2.0,  # Confirm the window still has focus this often (seconds, 0 = never)
+        },
+        "paste": {
+            "untypeable": True,  # Paste words containing characters the backend cannot type (accents, emoji, CJK)
+            "patterns": [],  # Regular expressions whose matches are pasted instead of typed (e.g. code blocks)
+            "min_run_length": 0,  # Paste runs without whitespace at least this long, like URLs (0 = off)
+            "paste_delay": 0.5,  # Time a paste takes, like reaching for the clipboard (seconds)
+        },
+        "engine": {
+            "seed": None,  # Random seed for reproducible runs (None = random)
+            "spin_threshold": 0.002,  # Busy-wait this long before each deadline for accuracy (seconds)
+            "backend": "pyautogui",  # Keystroke injection backend: pyautogui, xtest, recording or null
+            "backend_options": {},  # Extra keyword arguments for the backend (e.g. {"display": ":1"})
+            "progress_interval": 0.25,  # How often progress and telemetry are reported while typing (seconds)
+            "control_interval": 0.5,  # How often the speed controller adjusts the pace (seconds)
+            "burst_threshold": 0.001,  # Send characters planned closer together than this in one call (seconds, 0 = off)
+            "status_file": None,  # Path of a JSON status file kept up to date while typing
+            "events_fd": None,  # File descriptor receiving one JSON telemetry event per line
+            "trace_file": None,  # Record a per-action timing trace to this file (see --analyze-trace)
+            "checkpoint_file": None,  # Keep a resumable checkpoint of the current text in this file
+            "checkpoint_interval": 2.0,  # Minimum time between checkpoint writes (seconds)
         }
     }
     
-    def __init__(self, config_path=None, verbose=True):
-        """Initialize the Jeeves with configuration."""
-        # Initialize colorama for cross-platform colored terminal output
-        colorama.init()
+    def __init__(self, config_path=None, verbose=True, backend=None, window_registry=None):
+        """Initialize the Jeeves with configuration, an optional keystroke backend and window registry."""
+        # Initialize colorama for cross-platform colored terminal output; unlike
+        # colorama.init(), this is safe to repeat for every instance
+        colorama.just_fix_windows_console()
         
         # Initialize state
         self.current_browser_window = None
+        self.window_registry = window_registry
         self.verbose = verbose
+        self._rng = None
+        self._backend = backend
+        self.timing_stats = None
+        self.last_result = None  # Summary of the most recent typing run
+        self.telemetry_sinks = []  # Extra telemetry sinks (see telemetry.py) used for every run
+        
+        # Run control, usable from other threads
+        self._interrupt = threading.Event()  # Wakes the typing loop when pause or cancel is requested
+        self._resume = threading.Event()  # Cleared while paused
+        self._resume.set()
+        self._cancel_requested = False
+        self._running = False
         
         # Load configuration
         self.config = self.load_config(config_path)
     
+    @property
+    def rng(self):
+        """Random generator for keystroke planning, seeded from the config on first use."""
+        if self._rng is None:
+            import numpy as np
+            self._rng = np.random.default_rng(self.config["engine"]["seed"])
+        return self._rng
+    
+    @property
+    def backend(self):
+        """Keystroke injection backend, created from the config on first use."""
+        if self._backend is None:
+            engine = self.config["engine"]
+            self._backend = create_backend(engine["backend"], **engine["backend_options"])
+        return self._backend
+    
+    @backend.setter
+    def backend(self, backend):
+        self._backend = backend
+    
+    def seed(self, seed):
+        """Reseed the random generator so subsequent runs are reproducible."""
+        import numpy as np
+        self.config["engine"]["seed"] = seed
+        self._rng = np.random.default_rng(seed)
+    
+    def pause(self):
+        """Pause the current run before its next keystroke. Safe to call from another thread."""
+        self._resume.clear()
+        self._interrupt.set()
+    
+    def resume(self):
+        """Resume a paused run; its remaining schedule is shifted by the time spent paused."""
+        self._resume.set()
+    
+    def cancel(self):
+        """Stop the current run before its next keystroke. Safe to call from another thread."""
+        if not self._running:
+            return
+        self._cancel_requested = True
+        self._interrupt.set()
+        self._resume.set()
+    
+    @property
+    def paused(self):
+        """Whether a pause is currently in effect."""
+        return not self._resume.is_set()
+    
     def load_config(self, config_path):
         """Load configuration from a JSON file or use defaults."""
-        config = self.DEFAULT_CONFIG.copy()
+        config = copy.deepcopy(self.DEFAULT_CONFIG)
         
         if config_path and os.path.exists(config_path):
             try:
@@ -78,6 +171,25 @@ class Jeeves:
         
         return config
     
+    @staticmethod
+    def merge_config(config, overrides):
+        """
+        Return a copy of `config` with per-category `overrides` applied.
+        
+        Args:
+            config (dict): The base configuration (left untouched)
+            overrides (dict): Partial configuration, e.g. {"typing_speed": {"min_delay": 0.02}}
+        
+        Returns:
+            dict: The merged configuration
+        """
+        merged = copy.deepcopy(config)
+        for category, values in (overrides or {}).items():
+            if category not in merged:
+                raise ValueError(f"Unknown configuration category '{category}'")
+            merged[category].update(values)
+        return merged
+    
     def save_config(self, config_path="typer_config.json"):
         """Save the current configuration to a JSON file."""
         try:
@@ -90,84 +202,486 @@ class Jeeves:
             print(f"{Fore.RED}✗ Error saving configuration: {e}{Style.RESET_ALL}")
             return False
     
-    def type_with_realism(self, text):
-        """Type text with realistic human-like behavior."""
+    def type_with_realism(self, text, resume=False):
+        """
+        Type text with realistic human-like behavior.
+        
+        If engine.checkpoint_file is set, progress is checkpointed while
+        typing, and with `resume` the run continues from the checkpoint
+        left behind by an earlier, interrupted run of the same text.
+        
+        Args:
+            text (str): The text to type
+            resume (bool): Continue from the last committed character
+        
+        Returns:
+            bool: True if typing completed
+        """
+        run = self._prepare_text(text, resume)
+        if run is None:
+            return False
+        completed = self._type_chunks([text], **run)
+        self._report_checkpoint(completed, run["checkpoint"])
+        return completed
+    
+    async def type_async(self, text, resume=False):
+        """
+        Type text like type_with_realism, awaiting every delay on the running event loop.
+        
+        No thread is blocked while waiting, so many jobs (one Jeeves
+        instance each) can share one event loop. Delays are plain
+        asyncio sleeps without the final busy-wait, so keystrokes land
+        within the loop's timer resolution (about a millisecond) of their
+        planned times. pause(), resume() and cancel() work as for a
+        blocking run; cancelling the awaiting task also stops the run,
+        after its telemetry and checkpoint have recorded the progress.
+        
+        Args:
+            text (str): The text to type
+            resume (bool): Continue from the last committed character
+        
+        Returns:
+            bool: True if typing completed
+        """
+        run = self._prepare_text(text, resume)
+        if run is None:
+            return False
+        completed = await self._type_chunks_async([text], **run)
+        self._report_checkpoint(completed, run["checkpoint"])
+        return completed
+    
+    def start_async(self, text, resume=False):
+        """
+        Start typing text in a task on the running event loop.
+        
+        Args:
+            text (str): The text to type
+            resume (bool): Continue from the last committed character
+        
+        Returns:
+            TypingJob: Await it for the result, iterate it for progress snapshots
+        """
+        from async_typing import TypingJob
+        
+        return TypingJob(self, text, resume)
+    
+    def _prepare_text(self, text, resume):
+        """
+        Set up the checkpoint for typing `text` and announce the run.
+        
+        Returns:
+            dict: The total and checkpoint arguments for _type_chunks, or
+            None if the checkpoint belongs to a different text
+        """
+        engine = self.config["engine"]
+        checkpoint = None
+        if engine["checkpoint_file"]:
+            from checkpoint import CheckpointSink, load_checkpoint, text_digest
+            
+            digest = text_digest(text)
+            saved = load_checkpoint(engine["checkpoint_file"]) if resume else None
+            if saved and saved["text_hash"] != digest:
+                error = f"Checkpoint {engine['checkpoint_file']} belongs to a different text"
+                print(f"{Fore.RED}✗ {error}{Style.RESET_ALL}")
+                self.last_result = {"completed": False, "chars": 0, "elapsed": 0.0, "typos": 0, "pauses": 0,
+                                    "backspaces": 0, "error": error}
+                return None
+            if saved:
+                # Replaying the original generator state reproduces the original plan
+                self.rng.bit_generator.state = saved["rng_state"]
+            elif resume and self.verbose:
+                print(f"{Fore.YELLOW}ℹ No checkpoint found, starting from the beginning{Style.RESET_ALL}")
+            checkpoint = CheckpointSink(engine["checkpoint_file"], digest, self.rng.bit_generator.state,
+                                        saved["offset"] if saved else 0, engine["checkpoint_interval"],
+                                        saved["pending_typo"] if saved else False)
+        elif resume:
+            print(f"{Fore.YELLOW}ℹ No checkpoint file configured, starting from the beginning{Style.RESET_ALL}")
+        
+        offset = checkpoint.offset if checkpoint else 0
+        if self.verbose:
+            if offset:
+                print(f"{Fore.GREEN}► Resuming at character {Fore.CYAN}{offset}{Fore.GREEN} of "
+                      f"{Fore.CYAN}{len(text)}{Fore.GREEN}...{Style.RESET_ALL}")
+            else:
+                print(f"{Fore.GREEN}► Starting to type {Fore.CYAN}{len(text)}{Fore.GREEN} characters...{Style.RESET_ALL}")
+        return {"total": len(text) - offset, "checkpoint": checkpoint}
+    
+    def _report_checkpoint(self, completed, checkpoint):
+        """Tell the user how to resume a run that stopped with progress saved."""
+        if not completed and checkpoint and self.verbose and os.path.exists(checkpoint.path):
+            print(f"{Fore.YELLOW}ℹ Progress saved to {Fore.CYAN}{checkpoint.path}{Fore.YELLOW}; "
+                  f"resume with --resume{Style.RESET_ALL}")
+    
+    def type_stream(self, stream, total_bytes=None, chunk_size=None):
+        """
+        Type text read incrementally from a binary stream (file, pipe or stdin).
+        
+        Memory use is bounded by the chunk size regardless of input size, and
+        progress is reported in bytes.
+        
+        Args:
+            stream: A binary file-like object
+            total_bytes (int): Size of the input if known, for the progress bar
+            chunk_size (int): Bytes to read and plan at a time
+        
+        Returns:
+            bool: True if typing completed
+        """
+        from text_source import iter_text_chunks, DEFAULT_CHUNK_SIZE
+        
+        if self.verbose:
+            size = f"{total_bytes} bytes" if total_bytes is not None else "unknown size"
+            print(f"{Fore.GREEN}► Starting to type stream ({Fore.CYAN}{size}{Fore.GREEN})...{Style.RESET_ALL}")
+        chunks = iter_text_chunks(stream, chunk_size or DEFAULT_CHUNK_SIZE)
+        return self._type_chunks(chunks, total=total_bytes, byte_progress=True)
+    
+    def _type_chunks(self, chunks, total, byte_progress=False, checkpoint=None):
+        """
+        Plan and type a sequence of text chunks as one continuous run.
+        
+        Each chunk is planned just before it is typed, continuing the previous
+        chunk's timeline and paragraph detection, so only one chunk's plan is
+        held in memory at a time. With a checkpoint (see checkpoint.py), the
+        characters it has already committed are skipped.
+        """
+        from timing import PrecisionScheduler
+        
+        scheduler = PrecisionScheduler(self.config["engine"]["spin_threshold"], self._interrupt)
+        steps = self._run_chunks(chunks, total, byte_progress, scheduler, checkpoint)
+        self._running = True
+        try:
+            step = next(steps)
+            while True:
+                if step.__class__ is float:
+                    step = steps.send(scheduler.wait_until(step))
+                elif step[0] == _SLEEP:
+                    time.sleep(step[1])
+                    step = steps.send(None)
+                else:
+                    self._resume.wait()
+                    step = steps.send(None)
+        except StopIteration as done:
+            return done.value
+        finally:
+            steps.close()  # Lets the loop finish its telemetry if the driver itself was interrupted
+            self._end_run()
+    
+    async def _type_chunks_async(self, chunks, total, byte_progress=False, checkpoint=None):
+        """_type_chunks, serving the waits of the typing loop with asyncio sleeps."""
+        import asyncio
+        from timing import PrecisionScheduler
+        
+        if self._running:
+            raise RuntimeError("This Jeeves instance is already typing")
+        scheduler = PrecisionScheduler(0.0, self._interrupt)
+        interrupt = self._interrupt
+        perf_counter = time.perf_counter
+        sleep = asyncio.sleep
+        task_cancelled = False
+        steps = self._run_chunks(chunks, total, byte_progress, scheduler, checkpoint)
+        self._running = True
+        try:
+            step = next(steps)
+            while True:
+                reply = None
+                try:
+                    if step.__class__ is float:
+                        # Sleep in slices so pause and cancel requests are noticed during long gaps
+                        deadline = scheduler.deadline(step)
+                        now = perf_counter()
+                        while now < deadline and not interrupt.is_set():
+                            await sleep(min(deadline - now, ASYNC_POLL_INTERVAL))
+                            now = perf_counter()
+                        reply = now
+                    elif step[0] == _SLEEP:
+                        await sleep(step[1])
+                    else:
+                        while not self._resume.is_set():
+                            await sleep(ASYNC_POLL_INTERVAL)
+                except asyncio.CancelledError:
+                    # Stop like cancel() does, so the run still reports and checkpoints its progress
+                    task_cancelled = True
+                    self.cancel()
+                    reply = perf_counter()
+                step = steps.send(reply)
+        except StopIteration as done:
+            if task_cancelled:
+                raise asyncio.CancelledError()
+            return done.value
+        finally:
+            steps.close()
+            self._end_run()
+    
+    def _end_run(self):
+        # A cancel only applies to the run it was issued for; a pause stays in effect
+        self._running = False
+        self._cancel_requested = False
+        if self._resume.is_set():
+            self._interrupt.clear()
+    
+    def _telemetry_sinks(self, total, byte_progress, checkpoint=None):
+        """Build the telemetry sinks for one run from the config, the checkpoint and telemetry_sinks."""
+        from telemetry import ConsoleSink, StatusFileSink, EventStreamSink
+        
+        engine = self.config["engine"]
+        sinks = []
+        if self.verbose:
+            sinks.append(ConsoleSink(total, "bytes" if byte_progress else "chars"))
+        if engine["status_file"]:
+            sinks.append(StatusFileSink(engine["status_file"]))
+        if engine["events_fd"] is not None:
+            sinks.append(EventStreamSink(engine["events_fd"]))
+        if checkpoint is not None:
+            sinks.append(checkpoint)
+        return sinks + self.telemetry_sinks
+    
+    def _run_chunks(self, chunks, total, byte_progress, scheduler, checkpoint=None):
+        """
+        Body of _type_chunks, as a generator that leaves every wait to its driver.
+        
+        Yields the planned offset of each keystroke, to be sent back the
+        perf_counter time once `scheduler` says it is due (or the run is
+        interrupted); (_SLEEP, seconds) for a fixed wait; and (_RESUME, None)
+        while the run is paused. Returns whether typing completed.
+        """
+        from window_manager import find_browser_window, default_registry
+        from typing_plan import (build_keystroke_plan, coalesce_bursts, ACTION_TYPE, ACTION_TYPO, ACTION_PASTE,
+                                 ACTION_BURST, ACTION_PAUSE)
+        from segmenter import paste_segments
+        from speed_control import SpeedController, CHARS_PER_WORD, MAX_SCALE
+        from telemetry import Telemetry
+        from text_source import char_byte_lengths
+        from math import nan
+        
+        browser = self.config["browser"]
+        speed = self.config["typing_speed"]
+        engine = self.config["engine"]
+        registry = self.window_registry or default_registry
+        window = self.current_browser_window
+        if window and not (registry.is_valid(window, browser["window_title"], browser["match_mode"])
+                           and registry.is_focused(window)):
+            # Closed, renamed or left since the last run: look it up and activate it again
+            self.current_browser_window = None
         if not self.current_browser_window:
-            window_title = self.config["browser"]["window_title"]
-            window_index = self.config["browser"]["window_index"]
-            self.current_browser_window = find_browser_window(window_title, window_index, self.verbose)
+            self.current_browser_window = find_browser_window(
+                browser["window_title"], browser["window_index"], self.verbose,
+                browser["match_mode"], registry
+            )
             if not self.current_browser_window:
+                self.last_result = {"completed": False, "chars": 0, "elapsed": 0.0, "typos": 0, "pauses": 0,
+                                    "backspaces": 0, "error": f"No window matching '{browser['window_title']}' found"}
                 return False
             
             # Focus delay
-            time.sleep(self.config["browser"]["focus_delay"])
+            yield _SLEEP, browser["focus_delay"]
         
-        total_chars = len(text)
-        if self.verbose:
-            print(f"{Fore.GREEN}► Starting to type {Fore.CYAN}{total_chars}{Fore.GREEN} characters...{Style.RESET_ALL}")
-        
-        # Create progress bar
-        with tqdm(total=total_chars, 
-                  desc="Typing progress", 
-                  unit="chars",
-                  bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]",
-                  disable=not self.verbose) as pbar:
-            
-            # Process text character by character
-            i = 0
-            typos = 0
-            pauses = 0
-            
-            while i < total_chars:
-                # Simulate a pause in typing (thinking or distraction)
-                if random.random() < self.config["human_behavior"]["pause_probability"]:
-                    pause_duration = random.uniform(
-                        self.config["human_behavior"]["min_pause_duration"],
-                        self.config["human_behavior"]["max_pause_duration"]
-                    )
-                    time.sleep(pause_duration)
-                    pauses += 1
-                
-                # Paragraph pause (if we hit a newline character)
-                if i > 0 and text[i-1] == '\n' and text[i] == '\n':
-                    time.sleep(self.config["human_behavior"]["paragraph_pause"])
-                
-                # Type the current character
-                current_char = text[i]
+        window = self.current_browser_window
+        is_focused = registry.is_focused
+        focus_interval = browser["focus_check_interval"]
+        next_focus_check = float("inf")
+        lost_focus = False
+        
+        interrupt = self._interrupt
+        cancelled = False
+        
+        write = self.backend.write
+        press = self.backend.press
+        paste = self.backend.paste
+        charset = self.backend.charset
+        
+        controller = None
+        next_control = float("inf")
+        if speed["target_wpm"] or speed["finish_by"] is not None:
+            controller = SpeedController(scheduler, speed["target_wpm"], speed["finish_by"], total,
+                                         engine["control_interval"])
+            if speed["finish_by"] is not None and speed["finish_by"] <= time.time() and self.verbose:
+                print(f"{Fore.YELLOW}⚠ The finish-by time has already passed, typing as fast as allowed{Style.RESET_ALL}")
+        
+        burst_threshold = engine["burst_threshold"]
+        if controller is not None:
+            # Bursts are formed before the controller stretches the timeline (up to MAX_SCALE times),
+            # so only merge gaps that stay below the threshold however far they are stretched
+            burst_threshold /= MAX_SCALE
+        
+        telemetry = Telemetry(total, "bytes" if byte_progress else "chars", engine["progress_interval"],
+                              self._telemetry_sinks(total, byte_progress, checkpoint), scheduler)
+        counts = telemetry.counts
+        progress = 0
+        pasted = 0
+        next_emit = float("inf")
+        
+        trace = None
+        if engine["trace_file"]:
+            from keystroke_trace import TraceRecorder
+            trace = TraceRecorder(meta={"backend": self.backend.name, "config": self.config})
+        
+        planned_duration = 0.0
+        prev_char = ""
+        skip = checkpoint.offset if checkpoint else 0
+        state = "failed"
+        
+        try:
+            for text in chunks:
+                # Resolve every keystroke, typo and pause of this chunk up front
+                plan = build_keystroke_plan(text, self.config, self.rng,
+                                            start_offset=planned_duration, prev_char=prev_char,
+                                            segments=paste_segments(text, self.config["paste"], charset),
+                                            charset=charset)
+                if skip:
+                    # Drop the rows of committed characters and start the timeline at the first kept row
+                    plan = plan.tail(int(plan.positions.searchsorted(skip)))
+                    skipped = plan.offsets[0] if len(plan) else plan.end_offset
+                    plan.offsets = plan.offsets - skipped
+                    plan.end_offset -= skipped
+                if controller is not None:
+                    controller.plan(plan.chars - skip, plan.end_offset - planned_duration)
+                skip = 0
+                plan = coalesce_bursts(plan, text, burst_threshold)
+                keys = plan.keys.tolist()
+                actions = plan.actions.tolist()
+                offsets = plan.offsets.tolist()
+                positions = plan.positions.tolist()
+                weights = char_byte_lengths(text) if byte_progress else None
+                pastes = plan.pastes
+                bursts = plan.bursts
                 
-                # Simulate making a typo
-                if random.random() < self.config["typing_speed"]["mistake_probability"]:
-                    # Make a mistake (press a nearby key)
-                    nearby_keys = get_nearby_keys(current_char)
-                    if nearby_keys:
-                        typo_char = random.choice(nearby_keys)
-                        pyautogui.write(typo_char)
-                        time.sleep(self.config["typing_speed"]["correction_delay"])
-                        # Correct the mistake
-                        pyautogui.press('backspace')
-                        typos += 1
+                if scheduler.start_time is None:
+                    if checkpoint is not None and checkpoint.pending_typo:
+                        press('backspace')  # Erase the typo the interrupted run left on screen
+                    scheduler.start()
+                    if controller is not None:
+                        next_control = controller.start(scheduler.start_time, offsets[0] if offsets else 0.0)
+                    next_emit = telemetry.start(scheduler.start_time)
+                    if focus_interval > 0:
+                        next_focus_check = scheduler.start_time + focus_interval
                 
-                # Type the correct character
-                pyautogui.write(current_char)
+                # Replay the plan against absolute deadlines; pauses are just gaps between them
+                for i in range(len(keys)):
+                    action = actions[i]
+                    if action >= ACTION_PAUSE:
+                        counts[action] += 1
+                        if trace is not None:
+                            trace.add(action, scheduler.deadline(offsets[i]) - scheduler.origin, nan, 0.0)
+                        continue
+                    now = yield offsets[i]
+                    
+                    # Handle pause and cancel requests from other threads
+                    while interrupt.is_set():
+                        interrupt.clear()
+                        if self._cancel_requested:
+                            cancelled = True
+                            break
+                        if not self._resume.is_set():
+                            paused_at = time.perf_counter()
+                            yield _RESUME, None
+                            scheduler.shift(time.perf_counter() - paused_at)
+                        now = yield offsets[i]
+                    
+                    # Periodically make sure we are not typing into the wrong window
+                    if now >= next_focus_check:
+                        if not is_focused(window):
+                            lost_focus = True
+                        next_focus_check = now + focus_interval
+                    
+                    if cancelled or lost_focus:
+                        break
+                    
+                    if now >= next_emit:
+                        telemetry.progress = progress
+                        telemetry.pasted = pasted
+                        next_emit = telemetry.emit(now)
+                    
+                    if now >= next_control:
+                        next_control = controller.update(now, offsets[i], progress, counts[ACTION_TYPE] + pasted)
+                    
+                    scheduler.record(offsets[i], now)
+                    if action == ACTION_TYPE:
+                        write(keys[i])
+                        progress += weights[positions[i]] if weights else 1
+                    elif action == ACTION_TYPO:
+                        write(keys[i])
+                    elif action == ACTION_BURST:
+                        burst = bursts[positions[i]]
+                        write(burst)
+                        counts[ACTION_TYPE] += len(burst)
+                        if weights:
+                            progress += sum(weights[positions[i]:positions[i] + len(burst)])
+                        else:
+                            progress += len(burst)
+                    elif action == ACTION_PASTE:
+                        segment = pastes[positions[i]]
+                        paste(segment)
+                        pasted += len(segment)
+                        if weights:
+                            progress += sum(weights[positions[i]:positions[i] + len(segment)])
+                        else:
+                            progress += len(segment)
+                    else:
+                        press('backspace')
+                    counts[action] += 1  # Only once the key is sent, so checkpoints never count a failed key
+                    if trace is not None:
+                        trace.add(action, scheduler.deadline(offsets[i]) - scheduler.origin, now - scheduler.origin,
+                                  time.perf_counter() - now)
                 
-                # Random delay between keystrokes
-                delay = random.uniform(
-                    self.config["typing_speed"]["min_delay"],
-                    self.config["typing_speed"]["max_delay"]
-                )
-                time.sleep(delay)
+                if cancelled or lost_focus:
+                    break
                 
-                i += 1
-                pbar.update(1)
+                planned_duration = plan.end_offset
+                prev_char = text[-1:] or prev_char
+            
+            state = "lost_focus" if lost_focus else "cancelled" if cancelled else "completed"
+        finally:
+            telemetry.progress = progress
+            telemetry.pasted = pasted
+            telemetry.finish(state)
+            if trace is not None:
+                trace.save(engine["trace_file"])
+        
+        total_chars = telemetry.chars
+        typos = telemetry.typos
+        pauses = telemetry.pauses
+        elapsed = scheduler.elapsed() if scheduler.start_time is not None else 0.0
+        self.timing_stats = scheduler.stats()
+        error = "Target window lost focus" if lost_focus else "Cancelled" if cancelled else None
+        self.last_result = {
+            "completed": error is None,
+            "chars": total_chars,
+            "elapsed": elapsed,
+            "typos": typos,
+            "pauses": pauses,
+            "backspaces": telemetry.backspaces,
+            "pasted": pasted,
+            "error": error,
+        }
+        
+        if lost_focus:
+            self.current_browser_window = None
+            print(f"\n{Fore.RED}✗ Target window lost focus, stopped typing{Style.RESET_ALL}")
+            return False
+        if cancelled:
+            if self.verbose:
+                print(f"\n{Fore.YELLOW}⚠ Typing cancelled after {total_chars} characters{Style.RESET_ALL}")
+            return False
         
-        avg_speed = total_chars / (pbar.format_dict["elapsed"] or 1)  # Avoid division by zero
+        planned_speed = total_chars / (planned_duration or 1)
+        avg_speed = total_chars / (elapsed or 1)  # Avoid division by zero
         
         if self.verbose:
             print(f"\n{Fore.GREEN}✓ Typing completed successfully{Style.RESET_ALL}")
             print(f"  {Fore.BLUE}• Characters typed: {Fore.CYAN}{total_chars}{Style.RESET_ALL}")
-            print(f"  {Fore.BLUE}• Elapsed time: {Fore.CYAN}{pbar.format_dict['elapsed']:.2f}s{Style.RESET_ALL}")
-            print(f"  {Fore.BLUE}• Average speed: {Fore.CYAN}{avg_speed:.2f}{Fore.BLUE} chars/sec{Style.RESET_ALL}")
+            print(f"  {Fore.BLUE}• Elapsed time: {Fore.CYAN}{elapsed:.2f}s{Style.RESET_ALL}")
+            print(f"  {Fore.BLUE}• Average speed: {Fore.CYAN}{avg_speed:.2f}{Fore.BLUE} chars/sec (planned {planned_speed:.2f}){Style.RESET_ALL}")
+            if controller is not None:
+                target = (f"target {speed['target_wpm']:g} WPM" if speed["finish_by"] is None else
+                          f"{speed['finish_by'] - time.time():+.1f}s to the finish-by time")
+                print(f"  {Fore.BLUE}• Words per minute: {Fore.CYAN}{avg_speed * 60 / CHARS_PER_WORD:.1f}{Fore.BLUE} ({target}){Style.RESET_ALL}")
+            print(f"  {Fore.BLUE}• Timing error: {Fore.CYAN}{self.timing_stats['mean'] * 1000:.2f}ms{Fore.BLUE} mean, "
+                  f"{Fore.CYAN}{self.timing_stats['p99'] * 1000:.2f}ms{Fore.BLUE} p99, "
+                  f"{Fore.CYAN}{self.timing_stats['jitter'] * 1000:.2f}ms{Fore.BLUE} jitter{Style.RESET_ALL}")
             print(f"  {Fore.BLUE}• Typos made: {Fore.CYAN}{typos}{Style.RESET_ALL}")
             print(f"  {Fore.BLUE}• Pauses taken: {Fore.CYAN}{pauses}{Style.RESET_ALL}")
+            if pasted:
+                print(f"  {Fore.BLUE}• Pasted: {Fore.CYAN}{pasted}{Fore.BLUE} characters in "
+                      f"{telemetry.pastes} pastes{Style.RESET_ALL}")
         
         return True
\ No newline at end of file
@@ -0,0 +1,217 @@
+"""
+Jeeves - Human-like browser typing automation
+Keystroke planning: turns text and configuration into a replayable schedule
+"""
+
+import numpy as np
+
+from keyboard_layout import get_nearby_keys, sample_nearby_key
+
+# Action codes stored in KeystrokePlan.actions; codes from ACTION_PAUSE on send no key
+ACTION_TYPE = 0  # Type the intended character
+ACTION_TYPO = 1  # Type a wrong, nearby character
+ACTION_BACKSPACE = 2  # Erase the preceding typo
+ACTION_PASTE = 3  # Paste a whole segment through the clipboard (see KeystrokePlan.pastes)
+ACTION_BURST = 4  # Type several characters in one call (see KeystrokePlan.bursts)
+ACTION_PAUSE = 5  # Thinking or distraction pause (no key)
+ACTION_PARAGRAPH = 6  # Pause between paragraphs (no key)
+
+ACTION_NAMES = ("type", "typo", "backspace", "paste", "burst", "pause", "paragraph")
+
+MAX_BURST = 64  # Longest run of characters sent in one burst
+
+# The order in which the actions belonging to a single character happen
+_SLOTS = np.array(
+    [ACTION_PAUSE, ACTION_PARAGRAPH, ACTION_TYPO, ACTION_BACKSPACE, ACTION_TYPE],
+    dtype=np.int8,
+)
+
+
+class KeystrokePlan:
+    """
+    A precomputed keystroke schedule.
+
+    Row i of the plan is one action: keys[i] is the key to send (empty for
+    pauses, '\\b' for backspace), actions[i] the action code, offsets[i] the
+    absolute time in seconds from the start of the job at which the action
+    happens and positions[i] the index of the source character it belongs to.
+    A paste row stands for a whole segment, whose text is pastes[positions[i]],
+    and a burst row for the characters bursts[positions[i]].
+    """
+
+    def __init__(self, keys, actions, offsets, positions, end_offset, typos, pauses, chars=None, pastes=None,
+                 bursts=None):
+        self.keys = keys
+        self.actions = actions
+        self.offsets = offsets
+        self.positions = positions
+        self.end_offset = end_offset  # Time at which the last delay elapses
+        self.typos = typos
+        self.pauses = pauses
+        self.pastes = pastes or {}  # Start position -> pasted text
+        self.bursts = bursts or {}  # Start position -> characters typed in one call
+        if chars is None:
+            chars = int(np.count_nonzero(actions == ACTION_TYPE))
+        self.chars = chars  # Number of characters of source text covered by this plan
+
+    def __len__(self):
+        return len(self.actions)
+
+    def tail(self, first):
+        """The plan from row `first` on."""
+        return KeystrokePlan(self.keys[first:], self.actions[first:], self.offsets[first:], self.positions[first:],
+                             self.end_offset, self.typos, self.pauses, self.chars, self.pastes, self.bursts)
+
+
+def text_to_array(text):
+    """Convert a string to a NumPy array of single characters without a Python loop."""
+    return np.frombuffer(text.encode("utf-32-le"), dtype="<U1")
+
+
+def build_keystroke_plan(text, config, rng, start_offset=0.0, prev_char="", segments=(), charset=None):
+    """
+    Plan every keystroke, typo and pause needed to type `text`.
+
+    Args:
+        text (str): The text to plan
+        config (dict): A Jeeves configuration dictionary
+        rng (numpy.random.Generator): Source of randomness for the plan
+        start_offset (float): Time offset of the first action (seconds)
+        prev_char (str): The character typed just before `text`, used to
+            detect paragraph breaks that span two plans
+        segments (list): (start, end) runs to paste instead of type, from
+            segmenter.paste_segments
+        charset (str): Regex character class body of what the backend can
+            type; typos only land on those keys (None = any key)
+
+    Returns:
+        KeystrokePlan: The resolved schedule
+    """
+    speed = config["typing_speed"]
+    behavior = config["human_behavior"]
+    n = len(text)
+    chars = text_to_array(text)
+
+    # Thinking pauses
+    pause_mask = rng.random(n) < behavior["pause_probability"]
+    pause_durations = rng.uniform(behavior["min_pause_duration"], behavior["max_pause_duration"], n)
+
+    # Paragraph pauses happen on the second of two consecutive newlines
+    previous = np.empty(n, dtype="<U1")
+    if n:
+        previous[0] = prev_char[-1:] if prev_char else ""
+        previous[1:] = chars[:-1]
+    paragraph_mask = (chars == "\n") & (previous == "\n")
+
+    # Typos, only for characters that have neighbouring keys the backend can type
+    layout = speed["keyboard_layout"]
+    unique_chars, inverse = np.unique(chars, return_inverse=True)
+    has_neighbours = np.array([bool(get_nearby_keys(c, layout, charset)) for c in unique_chars.tolist()],
+                              dtype=bool)
+    typo_mask = rng.random(n) < speed["mistake_probability"]
+    if n:
+        typo_mask &= has_neighbours[inverse]
+    typo_positions = np.flatnonzero(typo_mask)
+    typo_keys = np.full(n, "", dtype="<U1")
+    typo_keys[typo_positions] = [
+        sample_nearby_key(c, u, layout, charset)
+        for c, u in zip(chars[typo_positions].tolist(), rng.random(len(typo_positions)).tolist())
+    ]
+
+    delays = rng.uniform(speed["min_delay"], speed["max_delay"], n)
+
+    # A pasted segment becomes one paste row at its first character, keeping
+    # a thinking pause before it; all other slots inside it are dropped
+    type_mask = np.ones(n, dtype=bool)
+    slot_actions = np.broadcast_to(_SLOTS, (n, len(_SLOTS)))
+    pastes = {}
+    if len(segments):
+        bounds = np.asarray(segments, dtype=np.int64)
+        starts = bounds[:, 0]
+        depth = np.zeros(n + 1, dtype=np.int64)
+        np.add.at(depth, starts, 1)
+        np.add.at(depth, bounds[:, 1], -1)
+        inside = np.cumsum(depth[:-1]) > 0
+        inner = inside.copy()
+        inner[starts] = False
+        paragraph_mask &= ~inside
+        typo_mask &= ~inside
+        pause_mask &= ~inner
+        type_mask = ~inner
+        slot_actions = slot_actions.copy()
+        slot_actions[starts, -1] = ACTION_PASTE
+        delays[starts] = config["paste"]["paste_delay"]
+        pastes = {start: text[start:end] for start, end in bounds.tolist()}
+
+    # Lay every character out as five slots, then drop the slots that don't happen
+    mask = np.stack([pause_mask, paragraph_mask, typo_mask, typo_mask, type_mask], axis=1).ravel()
+    durations = np.stack([
+        pause_durations,
+        np.full(n, behavior["paragraph_pause"]),
+        np.full(n, speed["correction_delay"]),
+        np.zeros(n),
+        delays,
+    ], axis=1).ravel()[mask]
+    empty = np.full(n, "", dtype="<U1")
+    keys = np.stack([empty, empty, typo_keys, np.full(n, "\b", dtype="<U1"), chars], axis=1).ravel()[mask]
+    actions = slot_actions.ravel()[mask]
+    positions = np.repeat(np.arange(n, dtype=np.int64), len(_SLOTS))[mask]
+
+    elapsed = np.cumsum(durations)
+    offsets = start_offset + np.concatenate(([0.0], elapsed[:-1])) if n else np.zeros(0)
+    end_offset = start_offset + (float(elapsed[-1]) if n else 0.0)
+
+    return KeystrokePlan(
+        keys=keys,
+        actions=actions,
+        offsets=offsets,
+        positions=positions,
+        end_offset=end_offset,
+        typos=int(np.count_nonzero(typo_mask)),
+        pauses=int(np.count_nonzero(pause_mask)),
+        chars=n,
+        pastes=pastes,
+    )
+
+
+def coalesce_bursts(plan, text, threshold):
+    """
+    Merge runs of characters planned less than `threshold` seconds apart into bursts.
+
+    Only consecutive ACTION_TYPE rows are merged, so bursts end at every
+    typo, paste and pause, and a burst is sent at the time its first
+    character was planned. Bursts are capped at MAX_BURST characters.
+
+    Args:
+        plan (KeystrokePlan): The plan to coalesce
+        text (str): The text the plan was built from
+        threshold (float): Largest gap between two characters of a burst (seconds)
+
+    Returns:
+        KeystrokePlan: The plan with one ACTION_BURST row per burst
+    """
+    n = len(plan)
+    if n < 2 or threshold <= 0:
+        return plan
+    is_type = plan.actions == ACTION_TYPE
+    gaps = np.diff(plan.offsets)
+    joins = np.zeros(n, dtype=bool)  # Row i continues the burst of row i - 1
+    joins[1:] = is_type[1:] & is_type[:-1] & (gaps < threshold)
+    if not joins.any():
+        return plan
+
+    # Start a new burst every MAX_BURST rows within a run
+    heads = np.flatnonzero(~joins)
+    run_start = heads[np.cumsum(~joins) - 1]
+    joins &= (np.arange(n) - run_start) % MAX_BURST != 0
+    heads = np.flatnonzero(~joins)
+    lengths = np.diff(heads, append=n)
+
+    actions = plan.actions[heads].copy()
+    positions = plan.positions[heads]
+    burst_heads = np.flatnonzero(lengths > 1)
+    actions[burst_heads] = ACTION_BURST
+    bursts = {start: text[start:start + length]
+              for start, length in zip(positions[burst_heads].tolist(), lengths[burst_heads].tolist())}
+    return KeystrokePlan(plan.keys[heads], actions, plan.offsets[heads], positions, plan.end_offset,
+                         plan.typos, plan.pauses, plan.chars, plan.pastes, bursts)
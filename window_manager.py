@@ -3,43 +3,260 @@ Jeeves - Human-like browser typing automation
 Window handling functionality
 """
 
-import pygetwindow as gw
+import re
 import time
 import colorama
 from colorama import Fore, Style
 
-def find_browser_window(window_title, window_index=0, verbose=True):
+MATCH_MODES = ("substring", "exact", "regex")
+
+
+class WindowRegistry:
+    """
+    Cache window handles and validate them cheaply before reuse.
+
+    Lookups are keyed by (pattern, match mode, index). A cached handle is
+    reused as long as it is still alive and its title still matches;
+    the desktop is only re-enumerated on a miss.
+
+    The provider is any object with pygetwindow's `getAllWindows()` and
+    `getActiveWindow()` functions, returning windows with `title`,
+    `visible` and `activate()`. It defaults to the pygetwindow module.
+    """
+
+    def __init__(self, provider=None):
+        self._provider = provider
+        self._cache = {}
+        self._patterns = {}
+
+    @property
+    def provider(self):
+        """The window provider, importing pygetwindow on first use if none was given."""
+        if self._provider is None:
+            import pygetwindow
+            self._provider = pygetwindow
+        return self._provider
+
+    def _compile(self, pattern, mode):
+        """Return a predicate that tells whether a title matches `pattern`."""
+        key = (pattern, mode)
+        matcher = self._patterns.get(key)
+        if matcher is None:
+            if mode == "substring":
+                matcher = lambda title: pattern in title
+            elif mode == "exact":
+                matcher = lambda title: title == pattern
+            elif mode == "regex":
+                matcher = re.compile(pattern).search
+            else:
+                raise ValueError(f"Unknown match mode '{mode}'. Available: {', '.join(MATCH_MODES)}")
+            self._patterns[key] = matcher
+        return matcher
+
+    def enumerate(self, pattern=None, mode="substring"):
+        """
+        Enumerate the visible windows on the desktop.
+
+        Args:
+            pattern (str): Only return windows whose title matches this
+            mode (str): How to match the pattern, one of MATCH_MODES
+
+        Returns:
+            list: The matching visible windows
+        """
+        windows = [w for w in self.provider.getAllWindows() if w.visible]
+        if pattern is None:
+            return windows
+        matches = self._compile(pattern, mode)
+        return [w for w in windows if matches(w.title)]
+
+    def is_valid(self, window, pattern, mode="substring"):
+        """Check that a handle is still alive, visible and titled as expected."""
+        try:
+            return bool(window.visible) and bool(self._compile(pattern, mode)(window.title))
+        except Exception:
+            return False  # The handle no longer refers to a window
+
+    def is_focused(self, window):
+        """Check whether `window` is the window currently receiving keyboard input."""
+        try:
+            return self.provider.getActiveWindow() == window
+        except Exception:
+            return False
+
+    def lookup(self, pattern, index=0, mode="substring"):
+        """
+        Return a cached, still-valid window or None on a miss.
+
+        Args:
+            pattern (str): The title pattern
+            index (int): Which matching window was requested
+            mode (str): How to match the pattern, one of MATCH_MODES
+        """
+        window = self._cache.get((pattern, mode, index))
+        if window is not None and self.is_valid(window, pattern, mode):
+            return window
+        self._cache.pop((pattern, mode, index), None)
+        return None
+
+    def remember(self, pattern, index, mode, window):
+        """Cache `window` as the answer for (pattern, index, mode)."""
+        self._cache[(pattern, mode, index)] = window
+
+    def invalidate(self, window=None):
+        """Forget one window, or every cached window if none is given."""
+        if window is None:
+            self._cache.clear()
+        else:
+            self._cache = {key: w for key, w in self._cache.items() if w != window}
+
+
+class XlibWindow:
+    """A top-level X11 window, with the attributes WindowRegistry expects."""
+
+    def __init__(self, provider, window):
+        self._provider = provider
+        self._window = window
+        self.id = window.id
+
+    @property
+    def title(self):
+        return self._provider.window_title(self._window)
+
+    @property
+    def visible(self):
+        from Xlib import X
+        return self._window.get_attributes().map_state == X.IsViewable
+
+    def activate(self):
+        self._provider.activate(self._window)
+
+    def __eq__(self, other):
+        return isinstance(other, XlibWindow) and other.id == self.id
+
+    def __hash__(self):
+        return hash(self.id)
+
+
+class XlibWindowProvider:
+    """
+    A window provider for one X display, using python-xlib.
+
+    pygetwindow has no Linux support, and it cannot address a display other
+    than the one the process started on. This provider works with any
+    display, for example one Xvfb server per parallel worker, with or without
+    a window manager. With an EWMH window manager, windows come from
+    _NET_CLIENT_LIST and activation goes through it. Without one, the
+    named children of the root window are used and the input focus is set
+    directly.
+    """
+
+    def __init__(self, display=None):
+        from Xlib.display import Display
+        self.display = Display(display)
+        self.root = self.display.screen().root
+        self._atoms = {}
+
+    def _atom(self, name):
+        atom = self._atoms.get(name)
+        if atom is None:
+            atom = self._atoms[name] = self.display.intern_atom(name)
+        return atom
+
+    def _root_property(self, name):
+        prop = self.root.get_full_property(self._atom(name), 0)
+        return list(prop.value) if prop is not None else None
+
+    def window_title(self, window):
+        prop = window.get_full_property(self._atom("_NET_WM_NAME"), self._atom("UTF8_STRING"))
+        if prop is not None:
+            value = prop.value
+            return value.decode("utf-8", "replace") if isinstance(value, bytes) else str(value)
+        name = window.get_wm_name()
+        if isinstance(name, bytes):
+            name = name.decode("latin-1")
+        return name or ""
+
+    def getAllWindows(self):
+        client_ids = self._root_property("_NET_CLIENT_LIST")
+        if client_ids is not None:
+            windows = [self.display.create_resource_object("window", wid) for wid in client_ids]
+        else:
+            windows = [w for w in self.root.query_tree().children if self.window_title(w)]
+        return [XlibWindow(self, window) for window in windows]
+
+    def getActiveWindow(self):
+        active = self._root_property("_NET_ACTIVE_WINDOW")
+        if active:
+            wid = active[0]
+        else:
+            focus = self.display.get_input_focus().focus
+            wid = getattr(focus, "id", 0)
+        if not wid:
+            return None
+        return XlibWindow(self, self.display.create_resource_object("window", wid))
+
+    def activate(self, window):
+        from Xlib import X, protocol
+        if self._root_property("_NET_SUPPORTED") is not None:
+            event = protocol.event.ClientMessage(
+                window=window, client_type=self._atom("_NET_ACTIVE_WINDOW"),
+                data=(32, [2, X.CurrentTime, 0, 0, 0]),  # 2 = request from a pager/tool
+            )
+            self.root.send_event(event, event_mask=X.SubstructureRedirectMask | X.SubstructureNotifyMask)
+        else:
+            window.raise_window()
+            window.set_input_focus(X.RevertToParent, X.CurrentTime)
+        self.display.sync()
+
+
+default_registry = WindowRegistry()
+
+
+def find_browser_window(window_title, window_index=0, verbose=True, match_mode="substring", registry=None):
     """
     Find and activate a browser window.
     
+    A previously found window is reused without enumerating the desktop
+    if it is still open and its title still matches.
+    
     Args:
         window_title (str): The title to search for in window titles
         window_index (int): Which window to use if multiple are found
         verbose (bool): Whether to print verbose output
+        match_mode (str): How to match the title: substring, exact or regex
+        registry (WindowRegistry): Registry to use (defaults to the shared one)
     
     Returns:
         window: The activated window object or None if no window found
     """
-    if verbose:
-        print(f"{Fore.BLUE}ℹ Searching for windows with title containing '{window_title}'...{Style.RESET_ALL}")
-    
-    windows = gw.getWindowsWithTitle(window_title)
+    registry = registry or default_registry
     
-    if not windows:
-        print(f"{Fore.RED}✗ No windows with title containing '{window_title}' found.{Style.RESET_ALL}")
-        return None
-    
-    if verbose and len(windows) > 1:
-        print(f"{Fore.BLUE}ℹ Found {len(windows)} matching windows:{Style.RESET_ALL}")
-        for i, win in enumerate(windows):
-            marker = "→ " if i == window_index else "  "
-            print(f"  {marker}{i}: {win.title}")
-    
-    if window_index >= len(windows):
-        print(f"{Fore.YELLOW}⚠ Window index {window_index} is out of range. Using first window instead.{Style.RESET_ALL}")
-        window_index = 0  # Default to first window
+    selected_window = registry.lookup(window_title, window_index, match_mode)
+    if selected_window is None:
+        if verbose:
+            print(f"{Fore.BLUE}ℹ Searching for windows with title matching '{window_title}' ({match_mode})...{Style.RESET_ALL}")
+        
+        windows = registry.enumerate(window_title, match_mode)
+        
+        if not windows:
+            print(f"{Fore.RED}✗ No windows with title matching '{window_title}' found.{Style.RESET_ALL}")
+            return None
+        
+        if verbose and len(windows) > 1:
+            print(f"{Fore.BLUE}ℹ Found {len(windows)} matching windows:{Style.RESET_ALL}")
+            for i, win in enumerate(windows):
+                marker = "→ " if i == window_index else "  "
+                print(f"  {marker}{i}: {win.title}")
+        
+        selected_index = window_index
+        if selected_index >= len(windows):
+            print(f"{Fore.YELLOW}⚠ Window index {window_index} is out of range. Using first window instead.{Style.RESET_ALL}")
+            selected_index = 0  # Default to first window
+        
+        selected_window = windows[selected_index]
+        registry.remember(window_title, window_index, match_mode, selected_window)
     
-    selected_window = windows[window_index]
     window_title = selected_window.title
     
     try:
@@ -48,18 +265,21 @@ def find_browser_window(window_title, window_index=0, verbose=True):
         selected_window.activate()
         return selected_window
     except Exception as e:
+        registry.invalidate(selected_window)
         print(f"{Fore.RED}✗ Error activating window: {e}{Style.RESET_ALL}")
         return None
 
-def list_browser_windows():
+def list_browser_windows(registry=None):
     """
     List all visible windows for the user to choose from.
     
+    Args:
+        registry (WindowRegistry): Registry to use (defaults to the shared one)
+    
     Returns:
         list: A list of all active windows
     """
-    windows = gw.getAllWindows()
-    active_windows = [w for w in windows if w.visible]
+    active_windows = (registry or default_registry).enumerate()
     
     print(f"{Fore.CYAN}Available windows:{Style.RESET_ALL}")
     print(f"{Fore.YELLOW}{'Index':<6} {'Title':<50}{Style.RESET_ALL}")
@@ -70,4 +290,4 @@ def list_browser_windows():
         else:
             print(f"{Fore.BLUE}{i:<6} {window.title[:50]}{Style.RESET_ALL}")
     
-    return active_windows
\ No newline at end of file
+    return active_windows